@@ -4,6 +4,8 @@ import tkinter as tk
 import typing as t
 from random import choice, randint
 
+from sha.drbg import HashDrbg, Seed
+
 from . import config
 from .drawer import draw
 from .enums import Orientation, Status
@@ -300,15 +302,17 @@ class Battleship:
 
     # AI part
 
-    def place_ai_boats(self) -> None:
-        """Place the AI's boats."""
+    def place_ai_boats(self, seed: t.Optional[Seed] = None) -> None:
+        """Place the AI's boats, reproducibly if a seed is given."""
         cur_boat = 0
+        rand, pick = randint, choice
+        if seed is not None:
+            drbg = HashDrbg(seed)
+            rand, pick = drbg.randint, drbg.choice
 
         while cur_boat < len(config.SIZES):
-            candidate = randint(0, config.GRID_SIZE - 1), randint(
-                0, config.GRID_SIZE - 1
-            )
-            orientation = choice((Orientation.NORTH, Orientation.EAST))
+            candidate = rand(0, config.GRID_SIZE - 1), rand(0, config.GRID_SIZE - 1)
+            orientation = pick((Orientation.NORTH, Orientation.EAST))
             # Only two orientations need to be considered
 
             boat = self._boat_cells(candidate, orientation, cur_boat)
@@ -0,0 +1,117 @@
+"""Better floating-point operations on NumPy arrays."""
+import math
+import typing as t
+
+import numpy as np
+
+from .float import FloatAdd
+
+__all__ = ("ArrayFloatAdd", "exact_sum")
+
+ArrayLike = t.Union[float, t.Sequence[float], np.ndarray]
+
+
+def _column_sums(matrix: np.ndarray) -> np.ndarray:
+    """Correctly rounded sum of each column of a matrix.
+
+    The columns are split into error-free partials, by the extraction of
+    Rump, Ogita and Oishi's AccSum: adding and subtracting a power of two
+    large enough cuts every value in a high part, whose sum is exact in
+    floating point, and a low part, which is extracted again. The
+    partials are then rounded together by math.fsum, which only sees a
+    few values per column.
+    """
+    rows, columns = matrix.shape
+    result = np.zeros(columns)
+    if not rows:
+        return result
+
+    finite = np.isfinite(matrix).all(axis=0)
+    scale = 2.0 ** math.ceil(math.log2(rows + 2))
+    low = np.where(finite, matrix, 0.0)
+    partials: t.List[np.ndarray] = []
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        while True:
+            bound = np.abs(low).max(axis=0)
+            if not bound.any():
+                break
+
+            sigma = np.ldexp(scale, np.frexp(bound)[1])
+            overflow = ~np.isfinite(sigma)
+            if overflow.any():
+                # Too close to the largest float, left to math.fsum
+                finite &= ~overflow
+                low[:, overflow] = 0.0
+                sigma[overflow] = 0.0
+
+            high = (sigma + low) - sigma
+            partials.append(high.sum(axis=0))
+            low = low - high
+
+    if partials:
+        result[:] = list(map(math.fsum, np.stack(partials, axis=1).tolist()))
+
+    for column in np.flatnonzero(~finite):
+        # Let math.fsum handle infinities, NaN and overflows
+        result[column] = math.fsum(matrix[:, column].tolist())
+
+    return result
+
+
+def exact_sum(
+    values: ArrayLike, axis: t.Optional[int] = None
+) -> t.Union[float, np.ndarray]:
+    """Correctly rounded sum of an array, along an axis or of all values.
+
+    The results are the same as those of math.fsum.
+    """
+    array = np.asarray(values, dtype=np.float64)
+
+    if axis is None:
+        return float(_column_sums(array.reshape(-1, 1))[0])
+
+    moved = np.moveaxis(array, axis, 0)
+    matrix = moved.reshape(moved.shape[0], math.prod(moved.shape[1:]))
+    return _column_sums(matrix).reshape(moved.shape[1:])
+
+
+class ArrayFloatAdd:
+    """Represent multiple floats kept as-is for precision, in a NumPy array."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: ArrayLike) -> None:
+        """Initialize the Float addition, without copying float64 arrays."""
+        self._values = np.asarray(values, dtype=np.float64)
+
+    def __add__(self, other: object) -> "ArrayFloatAdd":
+        """Add floats."""
+        if isinstance(other, (float, int)):
+            return ArrayFloatAdd(np.append(self._values, float(other)))
+
+        if isinstance(other, ArrayFloatAdd):
+            return ArrayFloatAdd(
+                np.concatenate((self._values.ravel(), other._values.ravel()))
+            )
+
+        if isinstance(other, FloatAdd):
+            return ArrayFloatAdd(np.append(self._values, other._values))
+
+        return NotImplemented
+
+    __radd__ = __add__
+
+    @property
+    def values(self) -> np.ndarray:
+        """Get the underlying array."""
+        return self._values
+
+    @property
+    def value(self) -> float:
+        """Get the value of the sum."""
+        return t.cast(float, exact_sum(self._values))
+
+    def sum(self, axis: t.Optional[int] = None) -> t.Union[float, np.ndarray]:
+        """Get the exact sums along an axis, or of all the values."""
+        return exact_sum(self._values, axis)
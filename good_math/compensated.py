@@ -0,0 +1,96 @@
+"""Exact and compensated dot products and polynomial evaluation.
+
+These rely on error-free transformations: TwoSum, and TwoProduct by
+Dekker's splitting, which represent the rounding error of a sum or of a
+product exactly as a second float. They are vectorized with NumPy and
+assume no overflow nor underflow occurs.
+"""
+import math
+import typing as t
+
+import numpy as np
+
+__all__ = ("dot", "polyval", "two_prod", "two_sum")
+
+ArrayLike = t.Union[float, t.Sequence[float], np.ndarray]
+
+_SPLITTER = 134217729.0  # 2^27 + 1
+
+
+def two_sum(a: ArrayLike, b: ArrayLike) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Return s and e such that s = fl(a + b) and a + b = s + e exactly."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+
+def _split(a: np.ndarray) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Split a into two halves of 26 bits, a = hi + lo."""
+    c = _SPLITTER * a
+    hi = c - (c - a)
+    return hi, a - hi
+
+
+def two_prod(a: ArrayLike, b: ArrayLike) -> t.Tuple[np.ndarray, np.ndarray]:
+    """Return p and e such that p = fl(a * b) and a * b = p + e exactly."""
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    p = a * b
+    a_hi, a_lo = _split(a)
+    b_hi, b_lo = _split(b)
+    return p, a_lo * b_lo - (((p - a_hi * b_hi) - a_lo * b_hi) - a_hi * b_lo)
+
+
+def _sum2(values: np.ndarray) -> float:
+    """Compensated sum, by pairwise TwoSum with the errors summed apart."""
+    errors: t.List[np.ndarray] = []
+    while values.size > 1:
+        if values.size % 2:
+            values = np.append(values, 0.0)
+        values, error = two_sum(values[0::2], values[1::2])
+        errors.append(error)
+
+    total = float(values[0]) if values.size else 0.0
+    return total + float(sum(np.sum(error) for error in errors))
+
+
+def dot(xs: ArrayLike, ys: ArrayLike, exact: bool = True) -> float:
+    """Dot product of two vectors.
+
+    The products are transformed into exact pairs of floats. If exact,
+    they are summed with math.fsum, giving the correctly rounded result.
+    Otherwise the sum is compensated, as accurate as if computed in twice
+    the working precision, and fully vectorized.
+    """
+    x = np.asarray(xs, dtype=np.float64).ravel()
+    y = np.asarray(ys, dtype=np.float64).ravel()
+    if x.shape != y.shape:
+        raise ValueError("The vectors must have the same length.")
+
+    products, errors = two_prod(x, y)
+    if exact:
+        return math.fsum(np.concatenate((products, errors)).tolist())
+    return _sum2(products) + float(np.sum(errors))
+
+
+def polyval(coeffs: t.Sequence[float], x: ArrayLike) -> np.ndarray:
+    """Compensated Horner evaluation of a polynomial at every point of x.
+
+    The coefficients are given from the highest degree, as for
+    numpy.polyval. The result is as accurate as if computed in twice the
+    working precision.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if not len(coeffs):
+        return np.zeros_like(x)
+
+    s = np.full_like(x, coeffs[0])
+    correction = np.zeros_like(x)
+    for coeff in coeffs[1:]:
+        p, product_error = two_prod(s, x)
+        s, sum_error = two_sum(p, coeff)
+        correction = correction * x + (product_error + sum_error)
+
+    return s + correction
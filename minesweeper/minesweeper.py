@@ -6,6 +6,8 @@ import typing as t
 from random import choice
 from tkinter import messagebox
 
+from sha.drbg import HashDrbg, Seed
+
 from . import config
 from .cell import Cell
 from .database import Database
@@ -192,16 +194,17 @@ class Minesweeper:
         self.main.resizable(False, False)
         self.main.focus_force()
 
-    def first_click(self, i: int, j: int) -> None:
-        """Plant the mines."""
+    def first_click(self, i: int, j: int, seed: t.Optional[Seed] = None) -> None:
+        """Plant the mines, reproducibly if a seed is given."""
         self.main.after(1000, self.incr_time, self.game_num)
         self.blank = False
+        pick = choice if seed is None else HashDrbg(seed).choice
         for _ in range(self.mines):
             x, y = i, j
             cell = self.grid[i][j]
 
             while (abs(x - i) <= 1 and abs(y - j) <= 1) or cell.ismine:
-                cell = choice(choice(self.grid))
+                cell = pick(pick(self.grid))
                 x, y = cell.coords
 
             cell.ismine = True
@@ -0,0 +1,5 @@
+"""Custom implementation of SHA-256."""
+from .files import hash_file
+from .sha256 import Midstate, Sha256, sha
+
+__all__ = ("sha", "hash_file", "Midstate", "Sha256")
@@ -0,0 +1,122 @@
+"""Print or check SHA-256 checksums, in the format of sha256sum."""
+import argparse
+import sys
+import typing as t
+
+from .files import _format, hash_file, hash_fileobj
+
+
+def _digest(name: str) -> str:
+    """Hash a file, - being the standard input."""
+    if name == "-":
+        return hash_fileobj(sys.stdin.buffer).hexdigest()
+    return hash_file(name)
+
+
+def _parse(line: str) -> t.Optional[t.Tuple[str, str]]:
+    """Parse a checksum line into a digest and a file name."""
+    escaped = line.startswith("\\")
+    if escaped:
+        line = line[1:]
+
+    digest, _, name = line.partition(" ")
+    if len(digest) != 64 or not name or name[0] not in " *":
+        return None
+    try:
+        int(digest, 16)
+    except ValueError:
+        return None
+
+    name = name[1:]
+    if escaped:
+        name = name.replace("\\\\", "\0").replace("\\n", "\n").replace("\0", "\\")
+    return digest.lower(), name
+
+
+def _check(checkfile: str, quiet: bool) -> bool:
+    """Check the checksums listed in a file."""
+    if checkfile == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(checkfile, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+
+    failed = unreadable = improper = 0
+    for line in lines:
+        parsed = _parse(line)
+        if parsed is None:
+            improper += 1
+            continue
+
+        digest, name = parsed
+        try:
+            ok = _digest(name) == digest
+        except OSError as error:
+            print(f"sha: {name}: {error.strerror}", file=sys.stderr)
+            print(f"{name}: FAILED open or read")
+            unreadable += 1
+            continue
+
+        if not ok:
+            failed += 1
+            print(f"{name}: FAILED")
+        elif not quiet:
+            print(f"{name}: OK")
+
+    if improper:
+        print(
+            f"sha: WARNING: {improper} line{'s are' if improper > 1 else ' is'}"
+            " improperly formatted",
+            file=sys.stderr,
+        )
+    if unreadable:
+        print(
+            f"sha: WARNING: {unreadable} listed file"
+            f"{'s' if unreadable > 1 else ''} could not be read",
+            file=sys.stderr,
+        )
+    if failed:
+        print(
+            f"sha: WARNING: {failed} computed checksum"
+            f"{'s' if failed > 1 else ''} did NOT match",
+            file=sys.stderr,
+        )
+    if improper == len(lines):
+        print(f"sha: {checkfile}: no properly formatted checksum lines found")
+        return False
+    return not (failed or unreadable)
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    """Run the command line tool."""
+    parser = argparse.ArgumentParser(
+        prog="python -m sha", description="Print or check SHA-256 checksums."
+    )
+    parser.add_argument("files", nargs="*", default=["-"], metavar="FILE")
+    parser.add_argument(
+        "-c",
+        "--check",
+        action="store_true",
+        help="read checksums from the FILEs and check them",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="don't print OK for each verified file"
+    )
+    args = parser.parse_args(argv)
+
+    success = True
+    for name in args.files:
+        try:
+            if args.check:
+                success &= _check(name, args.quiet)
+            else:
+                print(_format(_digest(name), name))
+        except OSError as error:
+            print(f"sha: {name}: {error.strerror}", file=sys.stderr)
+            success = False
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
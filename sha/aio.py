@@ -0,0 +1,72 @@
+"""Hash asynchronous streams without blocking the event loop."""
+import asyncio
+import typing as t
+from concurrent.futures import Executor
+
+from .sha256 import Sha256
+
+__all__ = ("hash_stream",)
+
+BATCH_SIZE = 1 << 20
+
+
+class _Reader(t.Protocol):
+    """Anything with the read method of asyncio.StreamReader."""
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to n bytes."""
+
+
+Stream = t.Union[_Reader, t.AsyncIterable[bytes]]
+
+
+def _feed(hasher: Sha256, data: bytes) -> Sha256:
+    """Update the hasher, returning it so that process executors work too."""
+    hasher.update(data)
+    return hasher
+
+
+async def _chunks(reader: Stream, batch_size: int) -> t.AsyncIterator[bytes]:
+    """Iterate over the data of a stream."""
+    if hasattr(reader, "read"):
+        while True:
+            chunk = await reader.read(batch_size)  # type: ignore
+            if not chunk:
+                return
+            yield chunk
+    else:
+        async for chunk in reader:  # type: ignore
+            yield chunk
+
+
+async def hash_stream(
+    reader: Stream,
+    executor: t.Optional[Executor] = None,
+    batch_size: int = BATCH_SIZE,
+) -> bytes:
+    """Return the SHA-256 digest of an asynchronous stream.
+
+    The data is hashed by batches of batch_size bytes in the executor, the
+    default one of the loop if None, while the next batch is being read.
+    """
+    loop = asyncio.get_running_loop()
+    hasher = Sha256()
+    hashing: t.Optional[asyncio.Future[Sha256]] = None
+    batch = bytearray()
+
+    async for chunk in _chunks(reader, batch_size):
+        batch += chunk
+        if len(batch) < batch_size:
+            continue
+
+        if hashing is not None:
+            hasher = await hashing
+        hashing = loop.run_in_executor(executor, _feed, hasher, bytes(batch))
+        batch.clear()
+
+    if hashing is not None:
+        hasher = await hashing
+    if batch:
+        hasher = await loop.run_in_executor(executor, _feed, hasher, bytes(batch))
+
+    return hasher.digest()
@@ -0,0 +1,88 @@
+"""SHA-256 of many messages at once, vectorized with NumPy."""
+import typing as t
+from collections import defaultdict
+
+import numpy as np
+
+from .sha256 import H, K, Buffer, _padding
+
+__all__ = ("sha_many",)
+
+_K = np.array(K, dtype=np.uint32)
+_H = np.array(H, dtype=np.uint32)
+
+
+def _rotr(n: int, x: np.ndarray) -> np.ndarray:
+    """ROTR SHA operator over every lane."""
+    return (x >> np.uint32(n)) | (x << np.uint32(32 - n))
+
+
+def _compress(list_h: np.ndarray, block: np.ndarray) -> np.ndarray:
+    """Compress one block per lane.
+
+    list_h has shape (8, lanes) and block has shape (16, lanes).
+    """
+    list_w = np.empty((64, block.shape[1]), dtype=np.uint32)
+    list_w[:16] = block
+
+    for i in range(16, 64):
+        w_15 = list_w[i - 15]
+        w_2 = list_w[i - 2]
+        σ0 = _rotr(7, w_15) ^ _rotr(18, w_15) ^ (w_15 >> np.uint32(3))
+        σ1 = _rotr(17, w_2) ^ _rotr(19, w_2) ^ (w_2 >> np.uint32(10))
+        list_w[i] = σ1 + list_w[i - 7] + σ0 + list_w[i - 16]
+
+    a, b, c, d, e, f, g, h = list_h
+
+    for i in range(64):
+        Σ1 = _rotr(6, e) ^ _rotr(11, e) ^ _rotr(25, e)
+        ch = (e & f) ^ (~e & g)
+        t1 = h + Σ1 + ch + _K[i] + list_w[i]
+        Σ0 = _rotr(2, a) ^ _rotr(13, a) ^ _rotr(22, a)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        h, g, f = g, f, e
+        e = d + t1
+        d, c, b = c, b, a
+        a = t1 + Σ0 + maj
+
+    return list_h + np.stack((a, b, c, d, e, f, g, h))
+
+
+def _sha_group(messages: t.List[bytes], blocks: int) -> t.List[bytes]:
+    """Hash messages which all pad to the same number of blocks."""
+    padded = b"".join(message + _padding(len(message)) for message in messages)
+    words = (
+        np.frombuffer(padded, dtype=">u4")
+        .astype(np.uint32)
+        .reshape(len(messages), blocks, 16)
+        .transpose(1, 2, 0)
+    )
+
+    list_h = np.repeat(_H[:, None], len(messages), axis=1)
+    for block in words:
+        list_h = _compress(list_h, block)
+
+    digests = list_h.T.astype(">u4").tobytes()
+    return [digests[i : i + 32] for i in range(0, len(digests), 32)]
+
+
+def sha_many(messages: t.Iterable[Buffer], lanes: int = 4096) -> t.List[bytes]:
+    """Return the SHA-256 digest of every message.
+
+    Messages are grouped by padded block count, and each group is hashed
+    lanes messages at a time.
+    """
+    data = [bytes(message) for message in messages]
+    groups: t.DefaultDict[int, t.List[int]] = defaultdict(list)
+    for index, message in enumerate(data):
+        groups[(len(message) + 72) // 64].append(index)
+
+    result: t.List[bytes] = [b""] * len(data)
+    for blocks, indices in groups.items():
+        for start in range(0, len(indices), lanes):
+            chunk = indices[start : start + lanes]
+            digests = _sha_group([data[i] for i in chunk], blocks)
+            for index, digest in zip(chunk, digests):
+                result[index] = digest
+
+    return result
@@ -0,0 +1,213 @@
+"""Benchmark the SHA-256 engines, checking their correctness first.
+
+Every engine must give the NIST test vectors, and every benchmark input
+must hash to the same digest as hashlib, before any timing is recorded.
+"""
+import argparse
+import hashlib
+import json
+import platform
+import subprocess
+import sys
+import time
+import typing as t
+
+from .sha256 import Sha256, sha
+
+__all__ = ("ENGINES", "NIST_VECTORS", "run")
+
+Engine = t.Callable[[t.List[bytes]], t.List[bytes]]
+
+NIST_VECTORS = (
+    (b"", "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"),
+    (b"abc", "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"),
+    (
+        b"abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq",
+        "248d6a61d20638b8e5c026930c3e6039a33ce45964ff2167f6ecedd419db06c1",
+    ),
+    (
+        b"abcdefghbcdefghicdefghijdefghijkefghijklfghijklmghijklmn"
+        b"hijklmnoijklmnopjklmnopqklmnopqrlmnopqrsmnopqrstnopqrstu",
+        "cf5b16a778af8380036ce59e7b0492370b249b11e8f07a51afac45037afee9d1",
+    ),
+    (
+        b"a" * 1_000_000,
+        "cdc76e5c9914fb9281a1c7e284d73e67f1809a48a497200e046d39ccc7112cd0",
+    ),
+)
+
+SIZES = (0, 1, 55, 56, 64, 1 << 10, 1 << 16, 1 << 20, 1 << 24, 1 << 26)
+
+
+def _reference(messages: t.List[bytes]) -> t.List[bytes]:
+    """sha.sha, the reference implementation."""
+    return [
+        bytes.fromhex(sha(int.from_bytes(data, "big"), 8 * len(data)))
+        for data in messages
+    ]
+
+
+def _unrolled(messages: t.List[bytes]) -> t.List[bytes]:
+    """Sha256, using the generated compression function."""
+    return [Sha256(data).digest() for data in messages]
+
+
+def _hashlib(messages: t.List[bytes]) -> t.List[bytes]:
+    """hashlib, as a baseline."""
+    return [hashlib.sha256(data).digest() for data in messages]
+
+
+ENGINES: t.Dict[str, Engine] = {
+    "reference": _reference,
+    "unrolled": _unrolled,
+    "hashlib": _hashlib,
+}
+
+try:
+    from .batch import sha_many
+except ImportError:  # NumPy is not installed
+    pass
+else:
+    ENGINES["batch"] = sha_many
+
+
+def _message(size: int, index: int) -> bytes:
+    """Deterministic message."""
+    seed = hashlib.sha256(f"{size}:{index}".encode()).digest()
+    return (seed * (size // 32 + 1))[:size]
+
+
+def _check(engine: Engine, max_size: t.Optional[int] = None) -> t.List[str]:
+    """Check an engine against the NIST vectors, returning the failures.
+
+    Vectors longer than max_size bytes are skipped.
+    """
+    failures: t.List[str] = []
+    for message, expected in NIST_VECTORS:
+        if max_size is not None and len(message) > max_size:
+            continue
+        if engine([message])[0].hex() != expected:
+            failures.append(f"NIST vector of {len(message)} bytes")
+    return failures
+
+
+def _git_commit() -> t.Optional[str]:
+    """Current commit, if any."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    engines: t.Iterable[str],
+    sizes: t.Iterable[int] = SIZES,
+    repeat: int = 3,
+    budget: int = 1 << 20,
+    max_reference_size: int = 1 << 20,
+    max_batch_size: int = 1 << 16,
+) -> t.Dict[str, t.Any]:
+    """Run the benchmark, returning the results as a JSON-serializable dict.
+
+    For each size, enough messages are hashed per run to reach budget
+    bytes, up to 4096 messages. The best of repeat runs is kept. The
+    reference and batch engines are slow on long messages, the latter
+    having a single lane per message, so they skip the sizes and NIST
+    vectors above max_reference_size and max_batch_size bytes.
+    """
+    results: t.List[t.Dict[str, t.Any]] = []
+    report: t.Dict[str, t.Any] = {
+        "commit": _git_commit(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": results,
+        "correct": True,
+    }
+
+    max_sizes = {"reference": max_reference_size, "batch": max_batch_size}
+    for name in engines:
+        engine = ENGINES[name]
+        max_size = max_sizes.get(name)
+        failures = _check(engine, max_size)
+        if failures:
+            report["correct"] = False
+            results.append({"engine": name, "correct": False, "errors": failures})
+            continue
+
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+
+            count = max(1, min(4096, budget // max(size, 1)))
+            messages = [_message(size, i) for i in range(count)]
+            expected = [hashlib.sha256(data).digest() for data in messages]
+            if engine(messages) != expected:
+                report["correct"] = False
+                results.append(
+                    {"engine": name, "size": size, "correct": False, "errors": []}
+                )
+                continue
+
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                engine(messages)
+                best = min(best, time.perf_counter() - start)
+
+            blocks = count * ((size + 72) // 64)
+            results.append(
+                {
+                    "engine": name,
+                    "size": size,
+                    "count": count,
+                    "correct": True,
+                    "seconds": best,
+                    "bytes_per_second": count * size / best,
+                    "blocks_per_second": blocks / best,
+                }
+            )
+
+    return report
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m sha.bench", description="Benchmark the SHA-256 engines."
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=sorted(ENGINES), default=sorted(ENGINES)
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=int, default=1 << 20)
+    parser.add_argument("--max-reference-size", type=int, default=1 << 20)
+    parser.add_argument("--max-batch-size", type=int, default=1 << 16)
+    parser.add_argument("--output", "-o", help="JSON file, standard output if none")
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.engines,
+        args.sizes,
+        args.repeat,
+        args.budget,
+        args.max_reference_size,
+        args.max_batch_size,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    return 0 if report["correct"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
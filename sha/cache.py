@@ -0,0 +1,167 @@
+"""Persistent cache of file digests, keyed by file identity."""
+import os
+import sqlite3
+import typing as t
+
+from .files import hash_file
+
+__all__ = ("HashCache",)
+
+PathLike = t.Union[str, "os.PathLike[str]"]
+Identity = t.Tuple[int, int, int, int]
+
+
+def _identity(path: PathLike) -> Identity:
+    """Device, inode, size and modification time of a file."""
+    stat = os.stat(path)
+    return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class HashCache:
+    """SQLite cache of SHA-256 digests.
+
+    A file is identified by its device and inode, and its digest is only
+    trusted if its size and modification time are unchanged. Otherwise the
+    entry is stale and is dropped.
+    """
+
+    __slots__ = ("con",)
+
+    def __init__(self, database: PathLike = "sha_cache.db") -> None:
+        """Initialize the connection."""
+        self.con = sqlite3.connect(database)
+        self.con.execute("PRAGMA journal_mode=WAL")
+        self.initialize()
+
+    def initialize(self) -> None:
+        """Table creation."""
+        cur = self.con.cursor()
+        cur.execute("""CREATE TABLE IF NOT EXISTS digests (
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                path TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                PRIMARY KEY (device, inode)
+            )
+            """)
+        self.con.commit()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.con.close()
+
+    def lookup(self, path: PathLike) -> t.Optional[str]:
+        """Return the cached digest of a file, without reading it."""
+        return self.lookup_many([path])[os.fspath(path)]
+
+    def lookup_many(self, paths: t.Iterable[PathLike]) -> dict[str, t.Optional[str]]:
+        """Return the cached digests of many files, None for misses."""
+        identities: dict[str, Identity] = {}
+        result: dict[str, t.Optional[str]] = {}
+        for path in map(os.fspath, paths):
+            result[path] = None
+            try:
+                identities[path] = _identity(path)
+            except OSError:
+                continue
+
+        cur = self.con.cursor()
+        cur.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS lookup (device INTEGER, inode INTEGER)"
+        )
+        cur.execute("DELETE FROM lookup")
+        cur.executemany(
+            "INSERT INTO lookup VALUES(?, ?)",
+            {identity[:2] for identity in identities.values()},
+        )
+        rows = {
+            (device, inode): (size, mtime_ns, digest)
+            for device, inode, size, mtime_ns, digest in cur.execute(
+                """SELECT d.device, d.inode, d.size, d.mtime_ns, d.digest
+                FROM digests d JOIN lookup l ON d.device=l.device AND d.inode=l.inode
+                """
+            )
+        }
+
+        stale: list[tuple[int, int]] = []
+        for path, (device, inode, size, mtime_ns) in identities.items():
+            row = rows.get((device, inode))
+            if row is None:
+                continue
+            if row[:2] == (size, mtime_ns):
+                result[path] = row[2]
+            else:
+                stale.append((device, inode))
+
+        cur.execute("DELETE FROM lookup")
+        cur.executemany("DELETE FROM digests WHERE device=? AND inode=?", stale)
+        self.con.commit()
+        return result
+
+    def hash_file(self, path: PathLike) -> str:
+        """Return the digest of a file, from the cache if it is up to date."""
+        errors: dict[str, OSError] = {}
+        result = self.hash_files([path], errors)
+        if errors:
+            raise errors[os.fspath(path)]
+        return result[os.fspath(path)]
+
+    def hash_files(
+        self,
+        paths: t.Iterable[PathLike],
+        errors: t.Optional[dict[str, OSError]] = None,
+    ) -> dict[str, str]:
+        """Return the digests of many files, hashing only the cache misses.
+
+        Files which can't be read are left out of the result, and their
+        errors are stored in errors if given. The other digests are still
+        cached.
+        """
+        cached = self.lookup_many(paths)
+        result: dict[str, str] = {}
+        new: list[tuple[int, int, int, int, str, str]] = []
+
+        for path, digest in cached.items():
+            if digest is not None:
+                result[path] = digest
+                continue
+
+            try:
+                identity = _identity(path)
+                result[path] = hash_file(path)
+                modified = _identity(path) != identity
+            except OSError as error:
+                result.pop(path, None)
+                if errors is not None:
+                    errors[path] = error
+                continue
+
+            if not modified:
+                # Don't cache a file modified while being hashed
+                new.append((*identity, path, result[path]))
+
+        self.con.executemany(
+            "INSERT OR REPLACE INTO digests VALUES(?, ?, ?, ?, ?, ?)", new
+        )
+        self.con.commit()
+        return result
+
+    def prune(self) -> int:
+        """Drop the entries of files which were changed or deleted."""
+        cur = self.con.cursor()
+        stale: list[tuple[int, int]] = []
+        for device, inode, size, mtime_ns, path in cur.execute(
+            "SELECT device, inode, size, mtime_ns, path FROM digests"
+        ).fetchall():
+            try:
+                if _identity(path) == (device, inode, size, mtime_ns):
+                    continue
+            except OSError:
+                pass
+            stale.append((device, inode))
+
+        cur.executemany("DELETE FROM digests WHERE device=? AND inode=?", stale)
+        self.con.commit()
+        return len(stale)
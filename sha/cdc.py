@@ -0,0 +1,162 @@
+"""Content-defined chunking, FastCDC style, with SHA-256 chunk digests.
+
+Boundaries are found with a gear rolling hash, so an insertion only
+changes the chunks around it. As in FastCDC, a stricter mask is used
+before the average size and a looser one after, which narrows the chunk
+size distribution, and no boundary is searched before the minimum size.
+"""
+import os
+import typing as t
+
+from .sha256 import Buffer, Sha256
+
+__all__ = ("Chunk", "DedupIndex", "chunk_data", "chunk_file", "chunk_stream")
+
+MIN_SIZE = 2 << 10
+AVG_SIZE = 8 << 10
+MAX_SIZE = 64 << 10
+READ_SIZE = 1 << 20
+
+_MASK64 = (1 << 64) - 1
+
+# Deterministic pseudorandom gear table
+GEAR = tuple(
+    int.from_bytes(Sha256(bytes((i,))).digest()[:8], "big") for i in range(256)
+)
+
+
+class Chunk(t.NamedTuple):
+    """A chunk of a stream."""
+
+    offset: int
+    length: int
+    digest: bytes
+
+
+def _masks(avg_size: int) -> t.Tuple[int, int]:
+    """Strict and loose masks for an average size, on the high bits."""
+    bits = avg_size.bit_length() - 1
+    strict = ((1 << (bits + 2)) - 1) << (64 - bits - 2)
+    loose = ((1 << (bits - 2)) - 1) << (64 - bits + 2)
+    return strict, loose
+
+
+def _cut(data: Buffer, min_size: int, avg_size: int, max_size: int) -> int:
+    """Length of the first chunk of data."""
+    size = len(data)
+    if size <= min_size:
+        return size
+
+    strict, loose = _masks(avg_size)
+    end = min(size, max_size)
+    normal = min(end, avg_size)
+    gear = GEAR
+    fingerprint = 0
+
+    for i in range(min_size, normal):
+        fingerprint = ((fingerprint << 1) + gear[data[i]]) & _MASK64
+        if not fingerprint & strict:
+            return i + 1
+
+    for i in range(normal, end):
+        fingerprint = ((fingerprint << 1) + gear[data[i]]) & _MASK64
+        if not fingerprint & loose:
+            return i + 1
+
+    return end
+
+
+def chunk_stream(
+    file: t.BinaryIO,
+    min_size: int = MIN_SIZE,
+    avg_size: int = AVG_SIZE,
+    max_size: int = MAX_SIZE,
+) -> t.Iterator[Chunk]:
+    """Split a binary file object into chunks."""
+    if not 64 <= min_size <= avg_size <= max_size:
+        raise ValueError("Expected 64 <= min_size <= avg_size <= max_size.")
+
+    buffer = bytearray()
+    offset = 0
+    eof = False
+
+    while True:
+        while not eof and len(buffer) < max_size:
+            data = file.read(max(max_size, READ_SIZE))
+            eof = not data
+            buffer += data
+
+        if not buffer:
+            return
+
+        length = _cut(buffer, min_size, avg_size, max_size)
+        yield Chunk(offset, length, Sha256(buffer[:length]).digest())
+        del buffer[:length]
+        offset += length
+
+
+def chunk_data(
+    data: Buffer,
+    min_size: int = MIN_SIZE,
+    avg_size: int = AVG_SIZE,
+    max_size: int = MAX_SIZE,
+) -> t.List[Chunk]:
+    """Split bytes-like data into chunks."""
+    if not 64 <= min_size <= avg_size <= max_size:
+        raise ValueError("Expected 64 <= min_size <= avg_size <= max_size.")
+
+    view = memoryview(data).cast("B")
+    chunks: t.List[Chunk] = []
+    offset = 0
+    while offset < len(view):
+        length = _cut(view[offset : offset + max_size], min_size, avg_size, max_size)
+        chunks.append(
+            Chunk(offset, length, Sha256(view[offset : offset + length]).digest())
+        )
+        offset += length
+
+    return chunks
+
+
+def chunk_file(
+    path: t.Union[str, "os.PathLike[str]"],
+    min_size: int = MIN_SIZE,
+    avg_size: int = AVG_SIZE,
+    max_size: int = MAX_SIZE,
+) -> t.List[Chunk]:
+    """Split a file into chunks."""
+    with open(path, "rb") as file:
+        return list(chunk_stream(file, min_size, avg_size, max_size))
+
+
+class DedupIndex:
+    """Index of the chunks already stored, shared across files."""
+
+    __slots__ = ("lengths", "total_bytes", "stored_bytes")
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.lengths: dict[bytes, int] = {}
+        self.total_bytes = 0
+        self.stored_bytes = 0
+
+    def __contains__(self, digest: bytes) -> bool:
+        """Check if a chunk is already stored."""
+        return digest in self.lengths
+
+    def add(self, chunks: t.Iterable[Chunk]) -> t.List[Chunk]:
+        """Index chunks, returning those which were not already stored."""
+        new: t.List[Chunk] = []
+        for chunk in chunks:
+            self.total_bytes += chunk.length
+            if chunk.digest not in self.lengths:
+                self.lengths[chunk.digest] = chunk.length
+                self.stored_bytes += chunk.length
+                new.append(chunk)
+
+        return new
+
+    @property
+    def ratio(self) -> float:
+        """Deduplication ratio, total bytes over stored bytes."""
+        return self.total_bytes / self.stored_bytes if self.stored_bytes else 1.0
@@ -0,0 +1,125 @@
+"""Deterministic random bit generator, Hash_DRBG of NIST SP 800-90A.
+
+Output is produced in counter mode by the Hashgen function, and is
+generated in bulk into a pool from which the helpers draw.
+"""
+import typing as t
+
+from .sha256 import Sha256
+
+__all__ = ("HashDrbg",)
+
+SEED_LENGTH = 55  # 440 bits for SHA-256
+POOL_SIZE = 4096
+RESEED_INTERVAL = 1 << 48
+
+_SEED_MODULUS = 1 << (8 * SEED_LENGTH)
+
+T = t.TypeVar("T")
+Seed = t.Union[bytes, bytearray, int, str]
+
+
+def _hash(data: bytes) -> bytes:
+    """SHA-256 digest."""
+    return Sha256(data).digest()
+
+
+def _hash_df(data: bytes, length: int) -> bytes:
+    """Hash derivation function, returning length bytes."""
+    result = b""
+    counter = 1
+    bits = (8 * length).to_bytes(4, "big")
+    while len(result) < length:
+        result += _hash(bytes((counter,)) + bits + data)
+        counter += 1
+    return result[:length]
+
+
+def _to_bytes(seed: Seed) -> bytes:
+    """Convert a seed to bytes."""
+    if isinstance(seed, int):
+        return seed.to_bytes((seed.bit_length() + 8) // 8, "big", signed=True)
+    if isinstance(seed, str):
+        return seed.encode()
+    return bytes(seed)
+
+
+class HashDrbg:
+    """Hash_DRBG with SHA-256, without prediction resistance."""
+
+    __slots__ = ("_v", "_c", "_reseed_counter", "_pool", "_position")
+
+    def __init__(self, seed: Seed, personalization: bytes = b"") -> None:
+        """Instantiate the generator from a seed."""
+        self._v = b""
+        self._c = b""
+        self._reseed_counter = 1
+        self._pool = b""
+        self._position = 0
+        self._instantiate(_to_bytes(seed) + personalization)
+
+    def _instantiate(self, seed_material: bytes) -> None:
+        """Derive V and C from the seed material."""
+        self._v = _hash_df(seed_material, SEED_LENGTH)
+        self._c = _hash_df(b"\x00" + self._v, SEED_LENGTH)
+        self._reseed_counter = 1
+        self._pool = b""
+        self._position = 0
+
+    def reseed(self, entropy: Seed) -> None:
+        """Mix new entropy in the state."""
+        self._instantiate(b"\x01" + self._v + _to_bytes(entropy))
+
+    def generate(self, length: int) -> bytes:
+        """Generate length bytes, bypassing the pool."""
+        if self._reseed_counter > RESEED_INTERVAL:
+            raise RuntimeError("The generator must be reseeded.")
+
+        output = bytearray()
+        data = int.from_bytes(self._v, "big")
+        while len(output) < length:
+            output += _hash(data.to_bytes(SEED_LENGTH, "big"))
+            data = (data + 1) % _SEED_MODULUS
+
+        v = int.from_bytes(self._v, "big")
+        v += int.from_bytes(_hash(b"\x03" + self._v), "big")
+        v += int.from_bytes(self._c, "big") + self._reseed_counter
+        self._v = (v % _SEED_MODULUS).to_bytes(SEED_LENGTH, "big")
+        self._reseed_counter += 1
+        return bytes(output[:length])
+
+    def randbytes(self, length: int) -> bytes:
+        """Draw length bytes from the pool."""
+        result = b""
+        while len(result) < length:
+            if self._position == len(self._pool):
+                self._pool = self.generate(max(POOL_SIZE, length - len(result)))
+                self._position = 0
+            end = min(len(self._pool), self._position + length - len(result))
+            result += self._pool[self._position : end]
+            self._position = end
+        return result
+
+    def randbits(self, k: int) -> int:
+        """Return a random integer of k bits."""
+        return int.from_bytes(self.randbytes((k + 7) // 8), "big") >> (-k % 8)
+
+    def randbelow(self, n: int) -> int:
+        """Return a random integer in [0, n), without modulo bias."""
+        if n <= 0:
+            raise ValueError("n must be positive.")
+        k = n.bit_length()
+        result = self.randbits(k)
+        while result >= n:
+            result = self.randbits(k)
+        return result
+
+    def randint(self, a: int, b: int) -> int:
+        """Return a random integer in [a, b]."""
+        return a + self.randbelow(b - a + 1)
+
+    def choice(self, seq: t.Sequence[T]) -> T:
+        """Return a random element of a non-empty sequence."""
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence.")
+        return seq[self.randbelow(len(seq))]
@@ -0,0 +1,96 @@
+"""Hash files with SHA-256 without loading them in memory."""
+import os
+import typing as t
+
+from .sha256 import Sha256
+
+__all__ = ("hash_file", "hash_file_resumable", "hash_fileobj")
+
+BUFFER_SIZE = 1 << 20  # Must be a multiple of the 64 bytes block size
+
+PathLike = t.Union[str, "os.PathLike[str]"]
+
+
+def hash_fileobj(
+    file: t.BinaryIO,
+    buffer_size: int = BUFFER_SIZE,
+    hasher: t.Optional[Sha256] = None,
+) -> Sha256:
+    """Hash a binary file object, reading it into a fixed-size buffer.
+
+    If hasher is given, the data is appended to what it was already fed.
+    """
+    if hasher is None:
+        hasher = Sha256()
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+
+    while True:
+        size = file.readinto(view)  # type: ignore
+        if not size:
+            return hasher
+        hasher.update(view[:size])
+
+
+def hash_file(path: PathLike, buffer_size: int = BUFFER_SIZE) -> str:
+    """Return the hexadecimal SHA-256 digest of a file."""
+    with open(path, "rb", buffering=0) as file:
+        return hash_fileobj(file, buffer_size).hexdigest()
+
+
+def _save_checkpoint(checkpoint: PathLike, hasher: Sha256) -> None:
+    """Atomically write the state of a hasher."""
+    temporary = f"{os.fspath(checkpoint)}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(hasher.to_bytes())
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, checkpoint)
+
+
+def hash_file_resumable(
+    path: PathLike,
+    checkpoint: PathLike,
+    interval: int = 1 << 28,
+    buffer_size: int = BUFFER_SIZE,
+) -> str:
+    """Return the digest of a file, saving the state every interval bytes.
+
+    If the checkpoint file exists, hashing resumes from the offset it
+    records. The file is assumed not to have changed in the meantime. The
+    checkpoint is deleted once the digest is computed.
+    """
+    try:
+        with open(checkpoint, "rb") as file:
+            hasher = Sha256.from_bytes(file.read())
+    except FileNotFoundError:
+        hasher = Sha256()
+
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    last_checkpoint = hasher.length
+
+    with open(path, "rb", buffering=0) as file:
+        file.seek(hasher.length)
+        while True:
+            size = file.readinto(view)
+            if not size:
+                break
+            hasher.update(view[:size])
+            if hasher.length - last_checkpoint >= interval:
+                _save_checkpoint(checkpoint, hasher)
+                last_checkpoint = hasher.length
+
+    try:
+        os.remove(checkpoint)
+    except FileNotFoundError:
+        pass
+    return hasher.hexdigest()
+
+
+def _format(digest: str, name: str) -> str:
+    """Format a checksum line, escaping the name like sha256sum."""
+    if "\\" in name or "\n" in name:
+        name = name.replace("\\", "\\\\").replace("\n", "\\n")
+        return f"\\{digest}  {name}"
+    return f"{digest}  {name}"
@@ -0,0 +1,86 @@
+"""HMAC-SHA256 and PBKDF2-HMAC-SHA256."""
+import struct
+import typing as t
+
+from .sha256 import Buffer, Midstate, Sha256, _compress_unrolled, _padding
+
+__all__ = ("HmacSha256", "hmac_sha256", "pbkdf2_hmac_sha256")
+
+_IPAD = bytes(x ^ 0x36 for x in range(256))
+_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+# Padding of a digest following a key block
+_DIGEST_PADDING = _padding(64 + 32)
+
+
+class HmacSha256:
+    """HMAC-SHA256 with a fixed key.
+
+    The key blocks are compressed once, and every message resumes from
+    the inner and outer midstates.
+    """
+
+    __slots__ = ("inner", "outer")
+
+    def __init__(self, key: Buffer) -> None:
+        """Compute the inner and outer midstates of the key."""
+        key = bytes(key)
+        if len(key) > 64:
+            key = Sha256(key).digest()
+        key = key.ljust(64, b"\0")
+
+        self.inner: Midstate = Sha256(key.translate(_IPAD)).midstate()
+        self.outer: Midstate = Sha256(key.translate(_OPAD)).midstate()
+
+    def digest(self, message: Buffer) -> bytes:
+        """Return the MAC of a message."""
+        inner = Sha256.from_midstate(self.inner, message).digest()
+        return Sha256.from_midstate(self.outer, inner).digest()
+
+    def hexdigest(self, message: Buffer) -> str:
+        """Return the MAC of a message as hexadecimal digits."""
+        return self.digest(message).hex()
+
+    def _digest_words(self, words: t.Tuple[int, ...]) -> t.Tuple[int, ...]:
+        """MAC of a digest given as eight words, in two compressions."""
+        inner = _compress_unrolled(
+            self.inner.state, struct.pack(">8L", *words) + _DIGEST_PADDING
+        )
+        return _compress_unrolled(
+            self.outer.state, struct.pack(">8L", *inner) + _DIGEST_PADDING
+        )
+
+
+def hmac_sha256(key: Buffer, message: Buffer) -> bytes:
+    """Return the HMAC-SHA256 of a message."""
+    return HmacSha256(key).digest(message)
+
+
+def pbkdf2_hmac_sha256(
+    password: Buffer,
+    salt: Buffer,
+    iterations: int,
+    dklen: t.Optional[int] = None,
+) -> bytes:
+    """Derive a key according to PBKDF2 with HMAC-SHA256."""
+    if iterations < 1:
+        raise ValueError("The number of iterations must be positive.")
+    if dklen is None:
+        dklen = 32
+    if dklen < 1:
+        raise ValueError("The key length must be positive.")
+
+    mac = HmacSha256(password)
+    salt = bytes(salt)
+    result = b""
+
+    for index in range(1, -(-dklen // 32) + 1):
+        words = struct.unpack(">8L", mac.digest(salt + index.to_bytes(4, "big")))
+        block = list(words)
+        for _ in range(iterations - 1):
+            words = mac._digest_words(words)
+            for i in range(8):
+                block[i] ^= words[i]
+        result += struct.pack(">8L", *block)
+
+    return result[:dklen]
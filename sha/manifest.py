@@ -0,0 +1,93 @@
+"""Hash whole directory trees across a process pool."""
+import contextlib
+import os
+import sys
+import typing as t
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .files import _format, hash_file
+
+__all__ = ("hash_tree", "write_manifest")
+
+PathLike = t.Union[str, "os.PathLike[str]"]
+
+
+def _walk(root: PathLike) -> t.List[t.Tuple[int, str]]:
+    """List the files of a tree with their size, largest first."""
+    files: t.List[t.Tuple[int, str]] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.path.isfile(path):
+                    files.append((os.path.getsize(path), path))
+            except OSError:  # Removed in the meantime
+                continue
+
+    # Largest files first, so that they don't end up alone on a core
+    files.sort(key=lambda item: -item[0])
+    return files
+
+
+def hash_tree(
+    root: PathLike,
+    workers: t.Optional[int] = None,
+    exclude: t.Collection[str] = (),
+    errors: t.Optional[t.Dict[str, OSError]] = None,
+) -> t.Iterator[t.Tuple[str, str]]:
+    """Yield the digest of each file in the tree as soon as it is computed.
+
+    Paths are relative to root, with forward slashes. Files which can't be
+    read are skipped, and their errors are stored in errors if given.
+    """
+    excluded = {os.path.realpath(path) for path in exclude}
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = {
+            executor.submit(hash_file, path): path
+            for _, path in _walk(root)
+            if os.path.realpath(path) not in excluded
+        }
+
+        for future in as_completed(futures):
+            name = os.path.relpath(futures[future], root).replace(os.sep, "/")
+            try:
+                digest = future.result()
+            except OSError as error:
+                if errors is not None:
+                    errors[name] = error
+                continue
+            yield name, digest
+
+
+def write_manifest(
+    root: PathLike,
+    output: PathLike,
+    workers: t.Optional[int] = None,
+) -> int:
+    """Write the sha256sum manifest of a tree, returning the number of files.
+
+    Lines are written in completion order, to a temporary file which then
+    replaces output. Files which can't be read are reported on standard
+    error, as sha256sum does, and left out.
+    """
+    count = 0
+    errors: t.Dict[str, OSError] = {}
+    temporary = f"{os.fspath(output)}.tmp"
+    try:
+        with open(temporary, "w", encoding="utf-8", newline="\n") as file:
+            for name, digest in hash_tree(
+                root, workers, exclude=(str(output), temporary), errors=errors
+            ):
+                file.write(_format(digest, name) + "\n")
+                count += 1
+        os.replace(temporary, output)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temporary)
+        raise
+
+    for name, error in errors.items():
+        print(f"sha: {name}: {error.strerror}", file=sys.stderr)
+    return count
@@ -0,0 +1,182 @@
+"""Merkle tree hashing of large files, with incremental updates.
+
+The file is split into fixed-size chunks. Leaves and nodes are hashed
+with distinct prefixes, as in RFC 6962, and an odd node is promoted to
+the next level as-is. Every level is kept in a sidecar index, so that
+after an edit only the dirty leaves and their paths to the root are
+recomputed.
+"""
+import os
+import struct
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+
+from .sha256 import Sha256
+
+__all__ = ("MerkleTree",)
+
+CHUNK_SIZE = 1 << 20
+MAGIC = b"SHAMRKL1"
+_HEADER = struct.Struct(">8sQQQ")
+_COUNT = struct.Struct(">Q")
+
+PathLike = t.Union[str, "os.PathLike[str]"]
+
+
+def _hash_leaf(path: PathLike, offset: int, length: int) -> bytes:
+    """Hash one chunk of a file."""
+    with open(path, "rb") as file:
+        file.seek(offset)
+        return Sha256(b"\x00" + file.read(length)).digest()
+
+
+def _hash_node(left: bytes, right: bytes) -> bytes:
+    """Hash two sibling nodes."""
+    return Sha256(b"\x01" + left + right).digest()
+
+
+class MerkleTree:
+    """Merkle tree of a file, stored level by level from the leaves."""
+
+    __slots__ = ("chunk_size", "size", "levels")
+
+    def __init__(self, chunk_size: int, size: int, levels: t.List[t.List[bytes]]):
+        """Initialize the tree."""
+        self.chunk_size = chunk_size
+        self.size = size
+        self.levels = levels
+
+    @property
+    def root(self) -> bytes:
+        """Root digest of the tree."""
+        return self.levels[-1][0]
+
+    def hexroot(self) -> str:
+        """Root digest of the tree, as hexadecimal digits."""
+        return self.root.hex()
+
+    @classmethod
+    def build(
+        cls,
+        path: PathLike,
+        chunk_size: int = CHUNK_SIZE,
+        workers: t.Optional[int] = None,
+    ) -> "MerkleTree":
+        """Hash a whole file."""
+        tree = cls(chunk_size, 0, [[]])
+        tree.update(path, workers=workers)
+        return tree
+
+    def _leaf_count(self) -> int:
+        """Number of leaves for the current size, an empty file having one."""
+        return max(1, -(-self.size // self.chunk_size))
+
+    def _hash_leaves(
+        self, path: PathLike, indices: t.List[int], workers: t.Optional[int]
+    ) -> t.List[bytes]:
+        """Hash some chunks of the file, in parallel if there are several."""
+        args = [(path, index * self.chunk_size, self.chunk_size) for index in indices]
+        if len(args) == 1 or workers == 1:
+            return [_hash_leaf(*arg) for arg in args]
+
+        with ProcessPoolExecutor(workers) as executor:
+            return list(executor.map(_hash_leaf, *zip(*args)))
+
+    def update(
+        self,
+        path: PathLike,
+        ranges: t.Iterable[t.Tuple[int, int]] = (),
+        workers: t.Optional[int] = None,
+    ) -> None:
+        """Rehash the chunks overlapping the (offset, length) ranges written.
+
+        Changes of the file size are detected, and the chunks they affect
+        are rehashed too.
+        """
+        old_count, old_size = len(self.levels[0]), self.size
+        self.size = os.path.getsize(path)
+        count = self._leaf_count()
+
+        dirty: t.Set[int] = set()
+        for offset, length in ranges:
+            first = offset // self.chunk_size
+            last = (offset + max(length, 1) - 1) // self.chunk_size
+            dirty.update(range(first, min(last + 1, count)))
+
+        if self.size != old_size or not old_count:
+            # The last chunk may have been truncated or extended
+            dirty.update(range(max(min(old_count, count) - 1, 0), count))
+
+        leaves = self.levels[0]
+        del leaves[count:]
+        leaves.extend(b"" for _ in range(count - len(leaves)))
+
+        indices = sorted(dirty)
+        for index, digest in zip(indices, self._hash_leaves(path, indices, workers)):
+            leaves[index] = digest
+
+        self._propagate(dirty, old_count)
+
+    def _propagate(self, dirty: t.Set[int], old_count: int) -> None:
+        """Recompute the nodes above the dirty ones, level by level."""
+        level = 0
+        while len(self.levels[level]) > 1:
+            children = self.levels[level]
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            parents = self.levels[level + 1]
+
+            old_parents = len(parents)
+            count = (len(children) + 1) // 2
+            del parents[count:]
+            parents.extend(b"" for _ in range(count - len(parents)))
+
+            dirty = {index // 2 for index in dirty}
+            if len(children) != old_count:
+                # The last node may switch between promoted and hashed
+                dirty.update(range(max(min(old_parents, count) - 1, 0), count))
+
+            for index in dirty:
+                if 2 * index + 1 < len(children):
+                    parents[index] = _hash_node(
+                        children[2 * index], children[2 * index + 1]
+                    )
+                else:
+                    parents[index] = children[2 * index]
+
+            old_count = old_parents
+            level += 1
+
+        del self.levels[level + 1 :]
+
+    def save(self, index: PathLike) -> None:
+        """Write the tree to a sidecar index file."""
+        with open(index, "wb") as file:
+            file.write(
+                _HEADER.pack(MAGIC, self.chunk_size, self.size, len(self.levels))
+            )
+            for nodes in self.levels:
+                file.write(_COUNT.pack(len(nodes)))
+                file.write(b"".join(nodes))
+
+    @classmethod
+    def load(cls, index: PathLike) -> "MerkleTree":
+        """Read a tree from a sidecar index file."""
+        with open(index, "rb") as file:
+            data = file.read()
+
+        magic, chunk_size, size, depth = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a Merkle tree index.")
+
+        offset = _HEADER.size
+        levels: t.List[t.List[bytes]] = []
+        for _ in range(depth):
+            (count,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            levels.append(
+                [data[offset + 32 * i : offset + 32 * (i + 1)] for i in range(count)]
+            )
+            offset += 32 * count
+
+        return cls(chunk_size, size, levels)
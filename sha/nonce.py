@@ -0,0 +1,217 @@
+"""Proof-of-work nonce search over SHA-256.
+
+A nonce is appended to a constant prefix, big-endian on nonce_size bytes,
+and is a solution when the digest, read as a big-endian integer, is below
+the target. The prefix's whole blocks are compressed once into a
+midstate. The remaining blocks are then compiled into a function of the
+nonce alone, where every part of the message schedule and of the rounds
+which does not depend on the nonce has been computed in advance.
+"""
+import functools
+import itertools
+import os
+import typing as t
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing import Manager
+
+from .sha256 import K, Buffer, Midstate, Sha256, _padding
+from .unrolled import MODULUS, _big_sigma, _sigma
+
+__all__ = ("find_nonce", "search_range")
+
+CHUNK_SIZE = 1 << 14
+
+Value = t.Union[int, str]
+
+
+class _Generator:
+    """Emit code for values, folding those which are constant."""
+
+    __slots__ = ("lines", "count")
+
+    def __init__(self) -> None:
+        """Initialize the generator."""
+        self.lines: t.List[str] = []
+        self.count = 0
+
+    def value(self, expr: str, *operands: Value) -> Value:
+        """Evaluate expr now if its operands are constant, else emit it."""
+        if all(isinstance(operand, int) for operand in operands):
+            return eval(expr)  # Only made of integer literals
+        name = f"v{self.count}"
+        self.count += 1
+        self.lines.append(f"    {name} = {expr}")
+        return name
+
+    def add(self, *operands: Value) -> Value:
+        """Sum modulo 2^32."""
+        constant = sum(x for x in operands if isinstance(x, int)) & MODULUS
+        names = [x for x in operands if isinstance(x, str)]
+        if not names:
+            return constant
+        return self.value(f"({' + '.join(names)} + {constant}) & {MODULUS}", *names)
+
+    def compress(
+        self, list_h: t.Sequence[Value], list_w: t.List[Value]
+    ) -> t.List[Value]:
+        """Compression function over possibly constant values."""
+        for i in range(16, 64):
+            w_2, w_15 = list_w[i - 2], list_w[i - 15]
+            list_w.append(
+                self.add(
+                    self.value(_sigma(str(w_2), (17, 19), 10), w_2),
+                    list_w[i - 7],
+                    self.value(_sigma(str(w_15), (7, 18), 3), w_15),
+                    list_w[i - 16],
+                )
+            )
+
+        a, b, c, d, e, f, g, h = list_h
+        for i in range(64):
+            t1 = self.add(
+                h,
+                self.value(_big_sigma(str(e), (6, 11, 25)), e),
+                self.value(f"{g} ^ ({e} & ({f} ^ {g}))", e, f, g),
+                K[i],
+                list_w[i],
+            )
+            t2 = self.add(
+                self.value(_big_sigma(str(a), (2, 13, 22)), a),
+                self.value(f"({a} & {b}) | ({c} & ({a} | {b}))", a, b, c),
+            )
+            h, g, f = g, f, e
+            e = self.add(d, t1)
+            d, c, b = c, b, a
+            a = self.add(t1, t2)
+
+        return [self.add(x, y) for x, y in zip(list_h, (a, b, c, d, e, f, g, h))]
+
+
+@functools.lru_cache(maxsize=16)
+def _checker(
+    midstate: Midstate, tail: bytes, nonce_size: int
+) -> t.Callable[[int], int]:
+    """Compile the function mapping a nonce to the digest as an integer."""
+    length = midstate.length + len(tail) + nonce_size
+    end = bytes(nonce_size) + _padding(length)
+    constant = int.from_bytes(tail + end, "big")
+    bits = 8 * (len(end) - nonce_size)  # Offset of the nonce from the end
+
+    generator = _Generator()
+    list_h: t.List[Value] = list(midstate.state)
+    for block in range((len(tail) + len(end)) // 64 - 1, -1, -1):
+        list_w: t.List[Value] = []
+        for i in range(16):
+            position = 512 * block + 32 * (15 - i)
+            word = (constant >> position) & MODULUS
+            if position + 32 <= bits or position >= bits + 8 * nonce_size:
+                list_w.append(word)
+                continue
+            shift = bits - position
+            shifted = f"nonce << {shift}" if shift >= 0 else f"nonce >> {-shift}"
+            list_w.append(generator.value(f"{word} | ({shifted}) & {MODULUS}", "nonce"))
+        list_h = generator.compress(list_h, list_w)
+
+    digest = " | ".join(f"{x} << {32 * (7 - i)}" for i, x in enumerate(list_h))
+    source = "\n".join(
+        ["def check(nonce):", *generator.lines, f"    return {digest}", ""]
+    )
+    namespace: t.Dict[str, t.Any] = {}
+    exec(compile(source, "<sha256 nonce>", "exec"), namespace)
+    return namespace["check"]
+
+
+def _split(prefix: Buffer) -> t.Tuple[Midstate, bytes]:
+    """Split a prefix into the midstate of its whole blocks and the rest."""
+    prefix = bytes(prefix)
+    aligned = len(prefix) - len(prefix) % 64
+    return Sha256(prefix[:aligned]).midstate(), prefix[aligned:]
+
+
+def _search(
+    midstate: Midstate,
+    tail: bytes,
+    nonce_size: int,
+    target: int,
+    start: int,
+    stop: int,
+    found: t.Any = None,
+) -> t.Optional[t.Tuple[int, bytes]]:
+    """Search a range of nonces, giving up once found is set."""
+    check = _checker(midstate, tail, nonce_size)
+    for low in range(start, stop, CHUNK_SIZE):
+        if found is not None and found.is_set():
+            return None
+        for nonce in range(low, min(low + CHUNK_SIZE, stop)):
+            digest = check(nonce)
+            if digest < target:
+                return nonce, digest.to_bytes(32, "big")
+    return None
+
+
+def search_range(
+    prefix: Buffer,
+    target: int,
+    start: int,
+    stop: int,
+    nonce_size: int = 8,
+) -> t.Optional[t.Tuple[int, bytes]]:
+    """Return the first nonce of the range solving the target, and its digest."""
+    if not 0 <= start <= stop <= 1 << (8 * nonce_size):
+        raise ValueError("The nonce range does not fit in nonce_size bytes.")
+    return _search(*_split(prefix), nonce_size, target, start, stop)
+
+
+def find_nonce(
+    prefix: Buffer,
+    target: int,
+    nonce_size: int = 8,
+    start: int = 0,
+    stop: t.Optional[int] = None,
+    workers: t.Optional[int] = None,
+    chunk_size: int = 1 << 18,
+) -> t.Optional[t.Tuple[int, bytes]]:
+    """Find a nonce solving the target across a process pool.
+
+    The range is split in chunks of chunk_size nonces. Once a solution is
+    found, pending chunks are cancelled and running ones stop early. The
+    solution is not necessarily the smallest one.
+    """
+    if stop is None:
+        stop = 1 << (8 * nonce_size)
+    if not 0 <= start <= stop <= 1 << (8 * nonce_size):
+        raise ValueError("The nonce range does not fit in nonce_size bytes.")
+
+    midstate, tail = _split(prefix)
+    chunks = iter(range(start, stop, chunk_size))
+
+    with Manager() as manager, ProcessPoolExecutor(workers) as executor:
+        found = manager.Event()
+        in_flight = 2 * (workers or os.cpu_count() or 1)
+        pending: t.Set[Future[t.Optional[t.Tuple[int, bytes]]]] = set()
+
+        while True:
+            for low in itertools.islice(chunks, in_flight - len(pending)):
+                pending.add(
+                    executor.submit(
+                        _search,
+                        midstate,
+                        tail,
+                        nonce_size,
+                        target,
+                        low,
+                        min(low + chunk_size, stop),
+                        found,
+                    )
+                )
+            if not pending:
+                return None
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result is not None:
+                    found.set()
+                    for other in pending:
+                        other.cancel()
+                    return result
@@ -0,0 +1,54 @@
+"""Reuse the compression of common message prefixes."""
+import functools
+import typing as t
+
+from .sha256 import Buffer, Midstate, Sha256
+
+__all__ = ("PrefixCache",)
+
+
+def _midstate(blocks: bytes) -> Midstate:
+    """Compress whole blocks from the initial state."""
+    return Sha256(blocks).midstate()
+
+
+class PrefixCache:
+    """LRU cache mapping message prefixes to their midstate.
+
+    Only the whole blocks of a prefix are cached, so prefixes sharing
+    their full blocks share an entry.
+    """
+
+    __slots__ = ("_midstate",)
+
+    def __init__(self, maxsize: t.Optional[int] = 128) -> None:
+        """Initialize the cache, holding at most maxsize midstates."""
+        self._midstate = functools.lru_cache(maxsize)(_midstate)
+
+    def hasher(self, prefix: Buffer) -> Sha256:
+        """Return a hash object which has already been fed prefix."""
+        prefix = bytes(prefix)
+        aligned = len(prefix) - len(prefix) % 64
+        return Sha256.from_midstate(
+            self._midstate(prefix[:aligned]), prefix[aligned:]
+        )
+
+    def digest(self, prefix: Buffer, suffix: Buffer) -> bytes:
+        """Return the digest of prefix + suffix."""
+        hasher = self.hasher(prefix)
+        hasher.update(suffix)
+        return hasher.digest()
+
+    def hexdigest(self, prefix: Buffer, suffix: Buffer) -> str:
+        """Return the hexadecimal digest of prefix + suffix."""
+        hasher = self.hasher(prefix)
+        hasher.update(suffix)
+        return hasher.hexdigest()
+
+    def cache_info(self) -> t.Any:
+        """Return the statistics of the underlying LRU cache."""
+        return self._midstate.cache_info()
+
+    def clear(self) -> None:
+        """Empty the cache."""
+        self._midstate.cache_clear()
@@ -0,0 +1,336 @@
+"""Pure Python implementation of SHA-256."""
+
+import struct
+from typing import NamedTuple, Optional, Tuple, Union
+
+from .unrolled import generate
+
+__all__ = ("sha", "Midstate", "Sha256")
+
+State = Tuple[int, ...]
+Buffer = Union[bytes, bytearray, memoryview]
+
+MODULUS = (1 << 32) - 1
+
+K = (
+    0x428A2F98,
+    0x71374491,
+    0xB5C0FBCF,
+    0xE9B5DBA5,
+    0x3956C25B,
+    0x59F111F1,
+    0x923F82A4,
+    0xAB1C5ED5,
+    0xD807AA98,
+    0x12835B01,
+    0x243185BE,
+    0x550C7DC3,
+    0x72BE5D74,
+    0x80DEB1FE,
+    0x9BDC06A7,
+    0xC19BF174,
+    0xE49B69C1,
+    0xEFBE4786,
+    0x0FC19DC6,
+    0x240CA1CC,
+    0x2DE92C6F,
+    0x4A7484AA,
+    0x5CB0A9DC,
+    0x76F988DA,
+    0x983E5152,
+    0xA831C66D,
+    0xB00327C8,
+    0xBF597FC7,
+    0xC6E00BF3,
+    0xD5A79147,
+    0x06CA6351,
+    0x14292967,
+    0x27B70A85,
+    0x2E1B2138,
+    0x4D2C6DFC,
+    0x53380D13,
+    0x650A7354,
+    0x766A0ABB,
+    0x81C2C92E,
+    0x92722C85,
+    0xA2BFE8A1,
+    0xA81A664B,
+    0xC24B8B70,
+    0xC76C51A3,
+    0xD192E819,
+    0xD6990624,
+    0xF40E3585,
+    0x106AA070,
+    0x19A4C116,
+    0x1E376C08,
+    0x2748774C,
+    0x34B0BCB5,
+    0x391C0CB3,
+    0x4ED8AA4A,
+    0x5B9CCA4F,
+    0x682E6FF3,
+    0x748F82EE,
+    0x78A5636F,
+    0x84C87814,
+    0x8CC70208,
+    0x90BEFFFA,
+    0xA4506CEB,
+    0xBEF9A3F7,
+    0xC67178F2,
+)
+
+H = (
+    0x6A09E667,
+    0xBB67AE85,
+    0x3C6EF372,
+    0xA54FF53A,
+    0x510E527F,
+    0x9B05688C,
+    0x1F83D9AB,
+    0x5BE0CD19,
+)
+
+
+def _add(*args: int) -> int:
+    """Add numbers modulo 2^32."""
+    result = 0
+    for x in args:
+        result = (result + x) & MODULUS
+    return result
+
+
+def _pad(message: int, length: int) -> int:
+    """Pad a message of length bits to blocks of 512 bits."""
+    padding_length = (447 - length) % 512
+    return (((message << 1) | 1) << (padding_length + 64)) | length
+
+
+def _rotr(n: int, x: int) -> int:
+    """ROTR SHA operator."""
+    return (x >> n) | ((x << (32 - n)) & MODULUS)
+
+
+def _ch(x: int, y: int, z: int) -> int:
+    """Ch SHA operator."""
+    return (x & y) ^ ((x ^ MODULUS) & z)
+
+
+def _maj(x: int, y: int, z: int) -> int:
+    """Maj SHA operator."""
+    return (x & y) ^ (x & z) ^ (y & z)
+
+
+def _Σ0(x: int) -> int:
+    """Σ0 SHA operator."""
+    return _rotr(2, x) ^ _rotr(13, x) ^ _rotr(22, x)
+
+
+def _Σ1(x: int) -> int:
+    """Σ1 SHA operator."""
+    return _rotr(6, x) ^ _rotr(11, x) ^ _rotr(25, x)
+
+
+def _σ0(x: int) -> int:
+    """σ0 SHA operator."""
+    return _rotr(7, x) ^ _rotr(18, x) ^ (x >> 3)
+
+
+def _σ1(x: int) -> int:
+    """σ1 SHA operator."""
+    return _rotr(17, x) ^ _rotr(19, x) ^ (x >> 10)
+
+
+def _repr(x: int) -> str:
+    """64 bits representation of x."""
+    raw = hex(x)[2:]
+    return "0" * (8 - len(raw)) + raw
+
+
+def _compress(list_h: State, block: Buffer, offset: int = 0) -> State:
+    """Apply the compression function to the 64 bytes block at offset."""
+    list_w = list(struct.unpack_from(">16L", block, offset))
+
+    for _ in range(48):
+        list_w.append(
+            _add(
+                _σ1(list_w[-2]),
+                list_w[-7],
+                _σ0(list_w[-15]),
+                list_w[-16],
+            )
+        )
+
+    a, b, c, d, e, f, g, h = list_h
+
+    for t in range(64):
+        t1 = _add(h, _Σ1(e), _ch(e, f, g), K[t], list_w[t])
+        t2 = _add(_Σ0(a), _maj(a, b, c))
+        h, g, f = g, f, e
+        e = _add(d, t1)
+        d, c, b = c, b, a
+        a = _add(t1, t2)
+
+    return (
+        _add(a, list_h[0]),
+        _add(b, list_h[1]),
+        _add(c, list_h[2]),
+        _add(d, list_h[3]),
+        _add(e, list_h[4]),
+        _add(f, list_h[5]),
+        _add(g, list_h[6]),
+        _add(h, list_h[7]),
+    )
+
+
+# Same function as _compress, much faster; _compress is kept as reference
+_compress_unrolled = generate(K)
+
+
+def _padding(length: int) -> bytes:
+    """Padding appended to a message of length bytes."""
+    return (
+        b"\x80"
+        + bytes((55 - length) % 64)
+        + ((length << 3) & ((1 << 64) - 1)).to_bytes(8, "big")
+    )
+
+
+def sha(message: int, length: Optional[int] = None) -> str:
+    """Hash a message according to SHA-256.
+
+    The message is the big-endian bit string of the integer, on length
+    bits if given, to allow leading zeros.
+    """
+    if message < 0:
+        raise ValueError("The message must be positive.")
+    if length is None:
+        length = message.bit_length()
+    if length < message.bit_length():
+        raise ValueError("The message is longer than its length.")
+    if length >= 1 << 64:
+        raise ValueError("Message too big.")
+
+    message = _pad(message, length)
+    data = message.to_bytes((length + 65 + (447 - length) % 512) // 8, "big")
+
+    list_h = H
+
+    for offset in range(0, len(data), 64):
+        list_h = _compress(list_h, data, offset)
+
+    return "".join(_repr(x) for x in list_h)
+
+
+_STATE = struct.Struct(">8LQ")
+
+
+class Midstate(NamedTuple):
+    """Compression state after a whole number of blocks."""
+
+    state: State
+    length: int  # Number of bytes compressed, a multiple of 64
+
+
+class Sha256:
+    """Incremental SHA-256 hash object, following the hashlib interface."""
+
+    __slots__ = ("_h", "_buffer", "_length")
+
+    name = "sha256"
+    digest_size = 32
+    block_size = 64
+
+    def __init__(self, data: Buffer = b"") -> None:
+        """Initialize the hash object."""
+        self._h: State = H
+        self._buffer = bytearray()
+        self._length = 0
+        self.update(data)
+
+    @classmethod
+    def from_midstate(cls, midstate: Midstate, data: Buffer = b"") -> "Sha256":
+        """Create a hash object resuming from a midstate."""
+        if midstate.length % 64:
+            raise ValueError("A midstate must cover whole blocks.")
+        hasher = cls()
+        hasher._h = midstate.state
+        hasher._length = midstate.length
+        hasher.update(data)
+        return hasher
+
+    @classmethod
+    def from_bytes(cls, state: Buffer) -> "Sha256":
+        """Restore a hash object from the output of to_bytes."""
+        state = bytes(state)
+        if len(state) < _STATE.size:
+            raise ValueError("Truncated SHA-256 state.")
+
+        *list_h, length = _STATE.unpack_from(state)
+        buffer = state[_STATE.size :]
+        if len(buffer) != length % 64:
+            raise ValueError("Inconsistent SHA-256 state.")
+
+        hasher = cls()
+        hasher._h = tuple(list_h)
+        hasher._buffer = bytearray(buffer)
+        hasher._length = length
+        return hasher
+
+    def to_bytes(self) -> bytes:
+        """Serialize the state: the eight words, the length and the partial block."""
+        return _STATE.pack(*self._h, self._length) + self._buffer
+
+    @property
+    def length(self) -> int:
+        """Number of bytes fed so far."""
+        return self._length
+
+    def midstate(self) -> Midstate:
+        """Return the state after the last full block fed."""
+        return Midstate(self._h, self._length - len(self._buffer))
+
+    def update(self, data: Buffer) -> None:
+        """Feed bytes-like data to the hash object."""
+        view = memoryview(data).cast("B")
+        self._length += len(view)
+        list_h = self._h
+        start = 0
+
+        if self._buffer:
+            start = 64 - len(self._buffer)
+            self._buffer += view[:start]
+            if len(self._buffer) < 64:
+                return
+            list_h = _compress_unrolled(list_h, self._buffer)
+            self._buffer.clear()
+
+        end = start + (len(view) - start) // 64 * 64
+        for offset in range(start, end, 64):
+            list_h = _compress_unrolled(list_h, view, offset)
+
+        self._buffer += view[end:]
+        self._h = list_h
+
+    def _final(self) -> State:
+        """Compute the final state without altering the hash object."""
+        tail = bytes(self._buffer) + _padding(self._length)
+        list_h = self._h
+        for offset in range(0, len(tail), 64):
+            list_h = _compress_unrolled(list_h, tail, offset)
+        return list_h
+
+    def digest(self) -> bytes:
+        """Return the digest of the data fed so far."""
+        return struct.pack(">8L", *self._final())
+
+    def hexdigest(self) -> str:
+        """Return the digest as a string of hexadecimal digits."""
+        return "".join(_repr(x) for x in self._final())
+
+    def copy(self) -> "Sha256":
+        """Return a copy of the hash object."""
+        other = Sha256.__new__(Sha256)
+        other._h = self._h
+        other._buffer = self._buffer.copy()
+        other._length = self._length
+        return other
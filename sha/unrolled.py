@@ -0,0 +1,75 @@
+"""Straight-line SHA-256 compression function, generated at import time.
+
+The generated function computes the same thing as sha256._compress, with
+the operators and round constants inlined, the message schedule held in
+local variables and the working variables rotated by renaming them.
+"""
+import struct
+import typing as t
+
+__all__ = ("generate", "source")
+
+MODULUS = 0xFFFFFFFF
+
+
+def _rotr(n: int, x: str) -> str:
+    """Unmasked ROTR expression, to be masked by the caller."""
+    return f"({x} >> {n} | {x} << {32 - n})"
+
+
+def _sigma(x: str, rotations: t.Tuple[int, int], shift: int) -> str:
+    """σ SHA operator expression."""
+    first, second = rotations
+    return f"(({_rotr(first, x)} ^ {_rotr(second, x)}) & {MODULUS} ^ {x} >> {shift})"
+
+
+def _big_sigma(x: str, rotations: t.Tuple[int, int, int]) -> str:
+    """Σ SHA operator expression."""
+    return "((" + " ^ ".join(_rotr(n, x) for n in rotations) + f") & {MODULUS})"
+
+
+def source(k: t.Sequence[int]) -> str:
+    """Return the source code of the compression function."""
+    lines = [
+        "def compress(list_h, block, offset=0, _unpack=_unpack):",
+        '    """Apply the compression function to the 64 bytes block at offset."""',
+        "    " + ", ".join(f"w{i}" for i in range(16)) + " = _unpack(block, offset)",
+    ]
+
+    for i in range(16, 64):
+        σ1 = _sigma(f"w{i - 2}", (17, 19), 10)
+        σ0 = _sigma(f"w{i - 15}", (7, 18), 3)
+        lines.append(f"    w{i} = ({σ1} + w{i - 7} + {σ0} + w{i - 16}) & {MODULUS}")
+
+    names = list("abcdefgh")
+    lines.append("    " + ", ".join(names) + " = list_h")
+
+    for i in range(64):
+        a, b, c, d, e, f, g, h = names
+        lines.append(
+            f"    t1 = {h} + {_big_sigma(e, (6, 11, 25))}"
+            f" + ({g} ^ ({e} & ({f} ^ {g}))) + {k[i]:#010x} + w{i}"
+        )
+        lines.append(f"    {d} = ({d} + t1) & {MODULUS}")
+        lines.append(
+            f"    {h} = (t1 + {_big_sigma(a, (2, 13, 22))}"
+            f" + (({a} & {b}) | ({c} & ({a} | {b})))) & {MODULUS}"
+        )
+        # The new a is stored in h and the new e in d
+        names = [h, a, b, c, d, e, f, g]
+
+    lines.append("    return (")
+    for i, name in enumerate(names):
+        lines.append(f"        (list_h[{i}] + {name}) & {MODULUS},")
+    lines.append("    )")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate(
+    k: t.Sequence[int],
+) -> t.Callable[[t.Tuple[int, ...], t.Any, int], t.Tuple[int, ...]]:
+    """Compile the compression function for the round constants k."""
+    namespace: t.Dict[str, t.Any] = {"_unpack": struct.Struct(">16L").unpack_from}
+    exec(compile(source(k), "<sha256 unrolled>", "exec"), namespace)
+    return namespace["compress"]
@@ -0,0 +1,20 @@
+"""Implementation of the sleepsort algorithm."""
+from .calibration import calibrated_sleep_sort
+from .compression import compressed_sleep_sort
+from .selection import argmin, kth_smallest, nsmallest, test_selection
+from .sleepsort import min_sleep, sleep_sort, sleep_sort_stream, test
+from .wheel import wheel_sort
+
+__all__ = (
+    "sleep_sort",
+    "sleep_sort_stream",
+    "calibrated_sleep_sort",
+    "compressed_sleep_sort",
+    "min_sleep",
+    "nsmallest",
+    "kth_smallest",
+    "argmin",
+    "test",
+    "test_selection",
+    "wheel_sort",
+)
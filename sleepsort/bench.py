@@ -0,0 +1,201 @@
+"""Benchmark sleep sort and measure how often it gets the order wrong.
+
+For each engine, input size, value distribution and sleep coefficient,
+the wall time, the number of tasks created and the fraction of outputs
+out of order are recorded, and the peak memory is traced by tracemalloc
+in a second run.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import typing as t
+from bisect import bisect_right
+
+from . import virtual
+from .compression import Schedule
+from .sleepsort import _sort
+from .wheel import _wheel_sort
+
+__all__ = ("DISTRIBUTIONS", "ENGINES", "run")
+
+Engine = t.Callable[[t.List[int], float], t.Coroutine[t.Any, t.Any, t.List[int]]]
+
+
+def _compressed(lst: t.List[int], sleep_coefficient: float) -> t.Any:
+    """Sleep sort on the compressed schedule."""
+    return _sort(lst, sleep_coefficient, Schedule(lst))
+
+
+ENGINES: t.Dict[str, Engine] = {
+    "tasks": lambda lst, coefficient: _sort(lst, coefficient),
+    "wheel": lambda lst, coefficient: _wheel_sort(lst, 1, coefficient),
+    "compressed": _compressed,
+}
+
+DISTRIBUTIONS: t.Dict[str, t.Callable[[random.Random, int], t.List[int]]] = {
+    "uniform": lambda rng, n: [rng.randrange(n) for _ in range(n)],
+    "reversed": lambda rng, n: list(range(n, 0, -1)),
+    "few_distinct": lambda rng, n: [rng.randrange(8) for _ in range(n)],
+    "outliers": lambda rng, n: [rng.randrange(n) for _ in range(n - 1)] + [100 * n],
+}
+
+
+def _out_of_order(result: t.List[int], lst: t.List[int]) -> float:
+    """Fraction of the outputs which are out of order.
+
+    These are the outputs outside a longest non-decreasing subsequence,
+    which is the least number of outputs to move to sort the result.
+    """
+    if sorted(result) != sorted(lst):
+        return 1.0
+    tails: t.List[int] = []
+    for elem in result:
+        index = bisect_right(tails, elem)
+        if index == len(tails):
+            tails.append(elem)
+        else:
+            tails[index] = elem
+    return (len(result) - len(tails)) / max(len(lst), 1)
+
+
+def _run(
+    engine: Engine,
+    lst: t.List[int],
+    sleep_coefficient: float,
+    virtual_clock: bool,
+    trace_memory: bool = False,
+) -> t.Dict[str, t.Any]:
+    """Run an engine once on a new loop."""
+    loop: asyncio.AbstractEventLoop = (
+        virtual.VirtualClockEventLoop() if virtual_clock else asyncio.new_event_loop()
+    )
+    tasks = 0
+
+    def task_factory(
+        loop: asyncio.AbstractEventLoop, coro: t.Any
+    ) -> "asyncio.Task[t.Any]":
+        """Count the tasks created."""
+        nonlocal tasks
+        tasks += 1
+        return asyncio.Task(coro, loop=loop)
+
+    loop.set_task_factory(task_factory)  # type: ignore
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = loop.run_until_complete(engine(lst, sleep_coefficient))
+    finally:
+        seconds = time.perf_counter() - start
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        loop.close()
+
+    if trace_memory:
+        return {"peak_memory": peak}
+    return {
+        "seconds": seconds,
+        "tasks": tasks,
+        "out_of_order": _out_of_order(result, lst),
+    }
+
+
+def _measure(
+    engine: Engine, lst: t.List[int], sleep_coefficient: float, virtual_clock: bool
+) -> t.Dict[str, t.Any]:
+    """Time an engine, then trace its memory in a separate run.
+
+    tracemalloc slows down the dispatch of the tasks, which would bias
+    both the wall time and the ordering errors.
+    """
+    point = _run(engine, lst, sleep_coefficient, virtual_clock)
+    point.update(_run(engine, lst, sleep_coefficient, virtual_clock, True))
+    return point
+
+
+def run(
+    engines: t.Iterable[str],
+    sizes: t.Iterable[int],
+    distributions: t.Iterable[str],
+    coefficients: t.Iterable[float],
+    virtual_clock: bool = False,
+    seed: int = 0,
+) -> t.Dict[str, t.Any]:
+    """Run the sweep, returning the results as a JSON-serializable dict."""
+    results: t.List[t.Dict[str, t.Any]] = []
+    rng = random.Random(seed)
+
+    for size in sizes:
+        for distribution in distributions:
+            lst = DISTRIBUTIONS[distribution](rng, size)
+            for coefficient in coefficients:
+                for name in engines:
+                    point = {
+                        "engine": name,
+                        "size": size,
+                        "distribution": distribution,
+                        "sleep_coefficient": coefficient,
+                    }
+                    point.update(
+                        _measure(ENGINES[name], lst, coefficient, virtual_clock)
+                    )
+                    results.append(point)
+
+    return {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "virtual_clock": virtual_clock,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m sleepsort.bench", description="Benchmark sleep sort."
+    )
+    parser.add_argument(
+        "--engines", nargs="+", choices=sorted(ENGINES), default=sorted(ENGINES)
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        choices=sorted(DISTRIBUTIONS),
+        default=sorted(DISTRIBUTIONS),
+    )
+    parser.add_argument(
+        "--coefficients", nargs="+", type=float, default=[1e-5, 1e-4, 1e-3]
+    )
+    parser.add_argument("--virtual-clock", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="JSON file, standard output if none")
+    args = parser.parse_args(argv)
+
+    report = run(
+        args.engines,
+        args.sizes,
+        args.distributions,
+        args.coefficients,
+        args.virtual_clock,
+        args.seed,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Calibration of the sleep coefficient against the host event loop.
+
+Two elements come out in the wrong order when the difference between
+their wake-up delays is smaller than the difference between their
+scheduling errors. Those errors have two sources, which are measured:
+the time spent creating and starting the tasks, which grows with the
+number of elements, and the lateness of the timers.
+"""
+import asyncio
+import functools
+import time
+import typing as t
+import warnings
+
+from .sleepsort import _sort
+
+__all__ = (
+    "Calibration",
+    "OrderingWarning",
+    "calibrate",
+    "calibrated_sleep_sort",
+    "coefficient",
+)
+
+PROBE_DELAY = 0.01
+
+
+class OrderingWarning(RuntimeWarning):
+    """The sleep sort could not guarantee a correct ordering."""
+
+
+class Calibration(t.NamedTuple):
+    """Scheduling characteristics of the event loop of this process."""
+
+    dispatch_cost: float  # Seconds between the starts of two tasks
+    lateness: t.Tuple[float, ...]  # Sorted lateness of the timers, in seconds
+    resolution: float  # Resolution of the clock of the loop
+
+
+async def _probe(samples: int) -> Calibration:
+    """Start tasks sleeping for the same delay, and measure their wake-up."""
+    calls: t.List[float] = []
+    lateness: t.List[float] = []
+
+    async def probe() -> None:
+        """Sleep and measure the lateness."""
+        call = time.perf_counter()
+        calls.append(call)
+        await asyncio.sleep(PROBE_DELAY)
+        lateness.append(time.perf_counter() - call - PROBE_DELAY)
+
+    await asyncio.gather(*(probe() for _ in range(samples)))
+    return Calibration(
+        (max(calls) - min(calls)) / max(samples - 1, 1),
+        tuple(sorted(lateness)),
+        time.get_clock_info("monotonic").resolution,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def calibrate(samples: int = 1000) -> Calibration:
+    """Measure the event loop, once per process."""
+    return asyncio.run(_probe(samples))
+
+
+def _quantile(values: t.Sequence[float], q: float) -> float:
+    """Quantile of sorted values."""
+    return values[min(len(values) - 1, max(0, round(q * (len(values) - 1))))]
+
+
+def coefficient(
+    n: int,
+    confidence: float = 0.99,
+    min_gap: float = 1,
+    calibration: t.Optional[Calibration] = None,
+) -> float:
+    """Smallest sleep coefficient expected to sort n elements correctly.
+
+    min_gap is the smallest difference between two distinct values, and
+    confidence the quantile of the lateness which must be absorbed, in
+    (0.5, 1].
+    """
+    if not 0.5 < confidence <= 1:
+        raise ValueError("The confidence must be in (0.5, 1].")
+    if calibration is None:
+        calibration = calibrate()
+    jitter = _quantile(calibration.lateness, confidence) - _quantile(
+        calibration.lateness, 1 - confidence
+    )
+    margin = jitter + calibration.dispatch_cost * n
+    return max(margin, calibration.resolution) / min_gap
+
+
+def calibrated_sleep_sort(
+    lst: t.List[int],
+    confidence: float = 0.99,
+    max_coefficient: float = 0.01,
+) -> t.List[int]:
+    """Sort the list with the calibrated sleep coefficient.
+
+    An OrderingWarning is emitted if the coefficient had to be capped at
+    max_coefficient, or if the result is not sorted nonetheless.
+    """
+    if not lst:
+        return []
+
+    sleep_coefficient = coefficient(len(lst), confidence)
+    if sleep_coefficient > max_coefficient:
+        warnings.warn(
+            f"A sleep coefficient of {sleep_coefficient:.3g}s is needed, "
+            f"capped to {max_coefficient:.3g}s: the ordering is not guaranteed.",
+            OrderingWarning,
+            stacklevel=2,
+        )
+        sleep_coefficient = max_coefficient
+
+    result = asyncio.run(_sort(lst, sleep_coefficient))
+    if any(a > b for a, b in zip(result, result[1:])):
+        warnings.warn(
+            "The elements woke up in the wrong order.", OrderingWarning, stacklevel=2
+        )
+    return result
@@ -0,0 +1,99 @@
+"""Order-preserving compression of the sleep schedule.
+
+The wall time of sleep sort is proportional to the range of the values,
+so a single outlier can stall it. Here the distinct values are first
+mapped onto a dense schedule by a monotonic piecewise linear function,
+built from quantile sketches: a strided sample of the distinct values
+delimits buckets, and a bucket is split again by a sketch of its own
+values until it holds a single value, or until its values are dense
+enough to keep their distances. Each distinct value is then at least one
+unit away from the next one, and the total sleep time is bounded by the
+number of distinct values rather than by their range.
+"""
+import asyncio
+import typing as t
+from bisect import bisect_right
+
+from . import virtual
+from .sleepsort import SLEEP_COEFFICIENT, _sort
+
+__all__ = ("Schedule", "compressed_sleep_sort")
+
+# Bucket of the sketch: its bounds, and the distinct values it holds
+_Bucket = t.Tuple[int, int, t.List[int]]
+
+
+class Schedule:
+    """Monotonic mapping of values to sleep offsets, in units."""
+
+    __slots__ = ("boundaries", "starts", "scales")
+
+    def __init__(self, lst: t.Sequence[int], buckets: int = 1024) -> None:
+        """Build the quantile sketches of the distinct values."""
+        buckets = max(2, buckets)
+        values = list(set(lst))
+
+        self.boundaries: t.List[int] = []
+        self.starts: t.List[float] = [0.0]
+        self.scales: t.List[float] = []
+
+        # Buckets are half-open, and processed from left to right
+        stack: t.List[_Bucket] = [(min(values), max(values) + 1, values)]
+        while stack:
+            low, high, values = stack.pop()
+            if len(values) > 1 and high - low > len(values):
+                stack.extend(reversed(self._split(low, high, values, buckets)))
+                continue
+
+            # A single value, or values at least one unit apart already
+            self.boundaries.append(low)
+            if len(values) > 1:
+                self.scales.append(1.0)
+                self.starts.append(self.starts[-1] + high - low)
+            else:
+                self.scales.append(0.0)
+                self.starts.append(self.starts[-1] + 1)
+
+    @staticmethod
+    def _split(
+        low: int, high: int, values: t.List[int], buckets: int
+    ) -> t.List[_Bucket]:
+        """Split a bucket on a strided sample of its values."""
+        points = sorted(set(values[:: max(1, len(values) // buckets)]) | {low})
+        parts: t.List[t.List[int]] = [[] for _ in points]
+        for value in values:
+            parts[bisect_right(points, value) - 1].append(value)
+        return [
+            (point, end, part)
+            for point, end, part in zip(points, points[1:] + [high], parts)
+            if part
+        ]
+
+    def __call__(self, elem: int) -> float:
+        """Sleep offset of a value, in units."""
+        index = min(bisect_right(self.boundaries, elem), len(self.scales)) - 1
+        if index < 0:
+            return 0.0
+        low = self.boundaries[index]
+        return self.starts[index] + (elem - low) * self.scales[index]
+
+    @property
+    def duration(self) -> float:
+        """Total duration of the schedule, in units."""
+        return self.starts[-1]
+
+
+def compressed_sleep_sort(
+    lst: t.List[int],
+    buckets: int = 1024,
+    virtual_clock: bool = False,
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+) -> t.List[int]:
+    """Sort the list using sleep sort on a compressed schedule."""
+    if not lst:
+        return []
+
+    coroutine = _sort(lst, sleep_coefficient, Schedule(lst, buckets))
+    if virtual_clock:
+        return virtual.run(coroutine)
+    return asyncio.run(coroutine)
@@ -0,0 +1,109 @@
+"""Selection by sleeping: smallest elements, k-th smallest and argmin.
+
+Every element gets a timer, offset from the minimum of the values so
+that the first one fires at once. As soon as k timers have fired, all
+the remaining ones are cancelled, so the latency depends on the answer
+rather than on the largest value.
+
+The offsets use the exact minimum rather than a cheaper bound. Creating
+the timers is already a pass over the values, so it does not change the
+complexity, whereas values below a sampled bound would all have to fire
+at once, in no particular order.
+"""
+import asyncio
+import typing as t
+
+from . import virtual
+from .sleepsort import SLEEP_COEFFICIENT
+
+__all__ = ("argmin", "kth_smallest", "nsmallest", "test_selection")
+
+
+async def _select(
+    k: int, values: t.List[int], sleep_coefficient: float
+) -> t.List[t.Tuple[int, int]]:
+    """Return the indices and values of the first k elements to wake up."""
+    k = min(k, len(values))
+    if k <= 0:
+        return []
+
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    woken: t.List[t.Tuple[int, int]] = []
+    baseline = min(values)
+
+    def wake(index: int, elem: int) -> None:
+        """Record an element which woke up."""
+        # Timers already due still run in the iteration which completes done
+        if done.done():
+            return
+        woken.append((index, elem))
+        if len(woken) == k:
+            done.set_result(None)
+
+    handles = [
+        loop.call_later(sleep_coefficient * (elem - baseline), wake, index, elem)
+        for index, elem in enumerate(values)
+    ]
+    try:
+        await done
+    finally:
+        for handle in handles:
+            handle.cancel()
+
+    return woken[:k]
+
+
+def _run(
+    k: int, values: t.Iterable[int], virtual_clock: bool, sleep_coefficient: float
+) -> t.List[t.Tuple[int, int]]:
+    """Run the selection on a new event loop."""
+    coroutine = _select(k, list(values), sleep_coefficient)
+    if virtual_clock:
+        return virtual.run(coroutine)
+    return asyncio.run(coroutine)
+
+
+def nsmallest(
+    k: int,
+    values: t.Iterable[int],
+    virtual_clock: bool = False,
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+) -> t.List[int]:
+    """Return the k smallest values, in increasing order."""
+    return [elem for _, elem in _run(k, values, virtual_clock, sleep_coefficient)]
+
+
+def kth_smallest(
+    k: int,
+    values: t.Iterable[int],
+    virtual_clock: bool = False,
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+) -> int:
+    """Return the k-th smallest value, k starting at 1."""
+    values = list(values)
+    if not 1 <= k <= len(values):
+        raise IndexError("k is out of range.")
+    return nsmallest(k, values, virtual_clock, sleep_coefficient)[-1]
+
+
+def argmin(
+    values: t.Iterable[int],
+    virtual_clock: bool = False,
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+) -> int:
+    """Return the index of the smallest value."""
+    woken = _run(1, values, virtual_clock, sleep_coefficient)
+    if not woken:
+        raise ValueError("argmin() arg is an empty sequence.")
+    return woken[0][0]
+
+
+def test_selection(n: int) -> bool:
+    """Test that nsmallest stops at k values, even when timers fire together."""
+    lst = list(range(n))
+    return (
+        nsmallest(2, [0] * n) == [0, 0]
+        and nsmallest(1, lst, sleep_coefficient=1e-6) == [0]
+        and kth_smallest(1, lst) == 0
+    )
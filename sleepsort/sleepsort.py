@@ -0,0 +1,191 @@
+"""Implementation of the sleepsort algorithm."""
+import asyncio
+import heapq
+import typing as t
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from . import virtual
+
+SLEEP_COEFFICIENT = 0.001
+
+# Rough cost of scheduling one element, in seconds, to balance shards
+DISPATCH_COST = 2e-5
+
+
+async def _sleep_all(
+    lst: t.List[int],
+    sleep_coefficient: float,
+    schedule: t.Optional[t.Callable[[int], float]],
+    wake: t.Callable[[int], t.Awaitable[None]],
+) -> None:
+    """Sleep for each element, and pass it to wake once its sleep ends.
+
+    Each element sleeps for schedule(elem) units, by default its distance
+    to the minimum.
+    """
+    futures: t.List[asyncio.Future[None]] = []
+
+    if schedule is None:
+        min_elem = min(lst)
+        schedule = lambda elem: elem - min_elem  # noqa: E731
+
+    async def sort_elem(elem: int) -> None:
+        """Sort the element."""
+        await asyncio.sleep(sleep_coefficient * schedule(elem))  # type: ignore
+        await wake(elem)
+
+    for elem in lst:
+        futures.append(asyncio.ensure_future(sort_elem(elem)))
+
+    await asyncio.gather(*futures)
+
+
+async def _sort(
+    lst: t.List[int],
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+    schedule: t.Optional[t.Callable[[int], float]] = None,
+) -> t.List[int]:
+    """Sleep sort algorithm."""
+    result: t.List[int] = []
+
+    async def append(elem: int) -> None:
+        """Collect the element."""
+        result.append(elem)
+
+    await _sleep_all(lst, sleep_coefficient, schedule, append)
+    return result
+
+
+async def sleep_sort_stream(
+    lst: t.Iterable[int],
+    maxsize: int = 64,
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+    schedule: t.Optional[t.Callable[[int], float]] = None,
+) -> t.AsyncIterator[int]:
+    """Yield the elements as soon as they wake up.
+
+    At most maxsize woken elements wait for a slow consumer; the others
+    wait to be queued, in the order they woke up.
+    """
+    lst = list(lst)
+    if not lst:
+        return
+
+    queue: asyncio.Queue[int] = asyncio.Queue(maxsize)
+    lock = asyncio.Lock()
+
+    async def put(elem: int) -> None:
+        """Queue the element, after those which woke up before it."""
+        # A full queue doesn't stop an element which woke up later from
+        # taking the slot freed for a waiting one, but the lock is fair
+        async with lock:
+            await queue.put(elem)
+
+    sleeping = asyncio.ensure_future(_sleep_all(lst, sleep_coefficient, schedule, put))
+    try:
+        for _ in lst:
+            yield await queue.get()
+    finally:
+        sleeping.cancel()
+
+
+def _sort_shard(
+    lst: t.List[int], virtual_clock: bool, sleep_coefficient: float
+) -> t.List[int]:
+    """Sort a shard, possibly in a worker process."""
+    if virtual_clock:
+        return virtual.run(_sort(lst, sleep_coefficient))
+    return asyncio.run(_sort(lst, sleep_coefficient))
+
+
+def _boundaries(
+    lst: t.List[int], workers: int, sleep_coefficient: float
+) -> t.List[int]:
+    """Split the values into ranges which should take as long to sort.
+
+    A shard costs its value range in sleep time plus a dispatch cost per
+    element. The costs are estimated on a strided sample of the values.
+    """
+    sample = sorted(lst[:: max(1, len(lst) // 1024)])
+    weight = DISPATCH_COST * len(lst) / len(sample)
+    total = sleep_coefficient * (sample[-1] - sample[0]) + weight * len(sample)
+
+    boundaries: t.List[int] = []
+    cost = 0.0
+    for previous, value in zip(sample, sample[1:]):
+        cost += sleep_coefficient * (value - previous) + weight
+        if cost >= total / workers and len(boundaries) < workers - 1:
+            boundaries.append(value)
+            cost = 0.0
+
+    return boundaries
+
+
+def sleep_sort(
+    lst: list[int],
+    virtual_clock: bool = False,
+    workers: int = 1,
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+) -> list[int]:
+    """Sort the list using the sleep sort algorithm.
+
+    With virtual_clock, the sleeps are simulated instead of waited for.
+    With several workers, the list is split in value ranges sorted in
+    separate processes, and the sorted runs are merged.
+    """
+    if workers <= 1 or len(lst) < 2:
+        return _sort_shard(lst, virtual_clock, sleep_coefficient)
+
+    boundaries = _boundaries(lst, workers, sleep_coefficient)
+    shards: t.List[t.List[int]] = [[] for _ in range(len(boundaries) + 1)]
+    for elem in lst:
+        shards[bisect_right(boundaries, elem)].append(elem)
+    shards = [shard for shard in shards if shard]
+
+    with ProcessPoolExecutor(len(shards)) as executor:
+        runs = list(
+            executor.map(
+                _sort_shard,
+                shards,
+                [virtual_clock] * len(shards),
+                [sleep_coefficient] * len(shards),
+            )
+        )
+
+    return list(heapq.merge(*runs))
+
+
+def test(n: int) -> bool:
+    """Test sleeps_sort on a presorted list."""
+    lst = list(range(n, 0, -1))
+    return sleep_sort(lst) == list(reversed(lst))
+
+
+async def _min(lst: t.Iterable[int]) -> int:
+    """Return the minimum element of a list."""
+    queue: asyncio.Queue[int] = asyncio.Queue(1)
+    tasks: t.List[asyncio.Task[None]] = []
+
+    lst = list(lst)
+    baseline = min(lst)
+
+    async def min_elem(elem: int) -> None:
+        """Find the minimum element."""
+        await asyncio.sleep(elem - baseline)
+        await queue.put(elem)
+
+    for elem in lst:
+        tasks.append(asyncio.create_task(min_elem(elem)))
+
+    result = await queue.get()
+    for task in tasks:
+        task.cancel()
+    return result
+
+
+def min_sleep(lst: t.Iterable[int], virtual_clock: bool = False) -> int:
+    """Return the minimum element of a list."""
+    if virtual_clock:
+        return virtual.run(_min(lst))
+    return asyncio.run(_min(lst))
@@ -0,0 +1,66 @@
+"""Event loop with a simulated clock.
+
+When nothing is ready to run, the loop jumps straight to the next timer
+deadline instead of waiting for it, so timers fire in the same order as
+on a real loop but without any wall clock time passing.
+"""
+import asyncio
+import selectors
+import typing as t
+
+__all__ = ("VirtualClockEventLoop", "run")
+
+T = t.TypeVar("T")
+
+
+class _VirtualSelector(selectors.DefaultSelector):  # type: ignore
+    """Selector advancing the clock of the loop instead of blocking."""
+
+    def __init__(self) -> None:
+        """Initialize the selector."""
+        super().__init__()
+        self.loop: t.Optional["VirtualClockEventLoop"] = None
+
+    def select(self, timeout: t.Optional[float] = None) -> t.Any:
+        """Poll for I/O, then advance the clock by the timeout if idle."""
+        if timeout is None or self.loop is None:
+            # No timer pending, only I/O can wake the loop up
+            return super().select(timeout)
+
+        events = super().select(0)
+        if not events and timeout > 0:
+            self.loop.advance(timeout)
+        return events
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Selector event loop whose time only moves when the loop is idle."""
+
+    def __init__(self) -> None:
+        """Initialize the loop at time zero."""
+        self._virtual_time = 0.0
+        selector = _VirtualSelector()
+        super().__init__(selector)
+        selector.loop = self
+
+    def time(self) -> float:
+        """Return the simulated time."""
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self._virtual_time += seconds
+
+
+def run(main: t.Coroutine[t.Any, t.Any, T]) -> T:
+    """Run a coroutine on a new virtual clock loop, like asyncio.run."""
+    loop = VirtualClockEventLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
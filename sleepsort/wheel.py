@@ -0,0 +1,115 @@
+"""Sleep sort driven by a hierarchical timer wheel.
+
+Equal values, or values within the same quantum, share a bucket, and the
+buckets are held in a hierarchical timer wheel. A single task sleeps
+until the next non-empty bucket is due, so memory grows with the number
+of distinct values instead of the number of elements.
+"""
+import asyncio
+import typing as t
+from collections import Counter
+
+from . import virtual
+from .sleepsort import SLEEP_COEFFICIENT
+
+__all__ = ("TimerWheel", "wheel_sort")
+
+T = t.TypeVar("T")
+
+
+class TimerWheel(t.Generic[T]):
+    """Hierarchical timer wheel over integer ticks.
+
+    An entry lives at the level of the highest group of bits where its
+    tick differs from the current one, and is cascaded to lower levels
+    when the wheel reaches its slot.
+    """
+
+    __slots__ = ("bits", "mask", "now", "wheels")
+
+    def __init__(self, max_tick: int, bits: int = 6) -> None:
+        """Initialize a wheel able to hold ticks up to max_tick."""
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.now = 0
+        levels = max(1, -(-max_tick.bit_length() // bits))
+        self.wheels: t.List[t.List[t.List[t.Tuple[int, T]]]] = [
+            [[] for _ in range(1 << bits)] for _ in range(levels)
+        ]
+
+    def insert(self, tick: int, item: T) -> None:
+        """Schedule an item at a tick, which must not be in the past."""
+        if tick < self.now:
+            raise ValueError("Cannot schedule in the past.")
+        level = max((tick ^ self.now).bit_length() - 1, 0) // self.bits
+        slot = (tick >> (self.bits * level)) & self.mask
+        self.wheels[level][slot].append((tick, item))
+
+    def next_tick(self) -> t.Optional[int]:
+        """Advance to the next tick with items, None if the wheel is empty."""
+        for level, wheel in enumerate(self.wheels):
+            shift = self.bits * level
+            for slot in range((self.now >> shift) & self.mask, 1 << self.bits):
+                if not wheel[slot]:
+                    continue
+                if level == 0:
+                    self.now = (self.now & ~self.mask) | slot
+                    return self.now
+
+                # Cascade the slot to the lower levels
+                entries, wheel[slot] = wheel[slot], []
+                high = shift + self.bits
+                self.now = (self.now >> high << high) | (slot << shift)
+                for tick, item in entries:
+                    self.insert(tick, item)
+                return self.next_tick()
+
+        return None
+
+    def pop(self) -> t.List[T]:
+        """Remove and return the items due at the current tick."""
+        slot = self.now & self.mask
+        entries, self.wheels[0][slot] = self.wheels[0][slot], []
+        return [item for _, item in entries]
+
+
+async def _wheel_sort(
+    lst: t.Iterable[int], quantum: int = 1, sleep_coefficient: float = SLEEP_COEFFICIENT
+) -> t.List[int]:
+    """Sleep sort algorithm, with one bucket per tick."""
+    counts = Counter(lst)
+    if not counts:
+        return []
+
+    min_elem = min(counts)
+    ticks = {value: (value - min_elem) // quantum for value in counts}
+    wheel: TimerWheel[t.Tuple[int, int]] = TimerWheel(max(ticks.values()))
+    for value, count in counts.items():
+        wheel.insert(ticks[value], (value, count))
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result: t.List[int] = []
+
+    tick = wheel.next_tick()
+    while tick is not None:
+        await asyncio.sleep(start + sleep_coefficient * quantum * tick - loop.time())
+        # Values sharing a quantum are woken together
+        for value, count in sorted(wheel.pop()):
+            result.extend([value] * count)
+        tick = wheel.next_tick()
+
+    return result
+
+
+def wheel_sort(
+    lst: t.Iterable[int],
+    quantum: int = 1,
+    virtual_clock: bool = False,
+    sleep_coefficient: float = SLEEP_COEFFICIENT,
+) -> t.List[int]:
+    """Sort the list using the sleep sort algorithm with a timer wheel."""
+    coroutine = _wheel_sort(lst, quantum, sleep_coefficient)
+    if virtual_clock:
+        return virtual.run(coroutine)
+    return asyncio.run(coroutine)